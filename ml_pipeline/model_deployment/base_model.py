@@ -15,6 +15,8 @@ from sklearn.metrics import (
     f1_score
 )
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
 # Configure logging
@@ -25,10 +27,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Thread-local flag set while an outer model forwards already-preprocessed data
+_preprocess_state = threading.local()
+
+
+@contextmanager
+def preprocessed_input():
+    """
+    Mark data passed to nested models on this thread as already preprocessed
+    
+    Used by ensembles so that base models invoked through sklearn's
+    VotingRegressor/StackingRegressor skip ``preprocess_data`` instead of
+    repeating the pass the ensemble already performed.
+    """
+    previous = getattr(_preprocess_state, 'active', False)
+    _preprocess_state.active = True
+    try:
+        yield
+    finally:
+        _preprocess_state.active = previous
+
 class BaseMLModel(BaseEstimator, TransformerMixin, ABC):
     """
     Abstract base model for sports prop prediction models
     Provides standard interfaces and utility methods for model development
+
+    Inputs are normalised to C-contiguous float32 at the entry of
+    ``train``/``predict``; overrides of ``preprocess_data`` must preserve
+    that dtype so no float64 copy is introduced downstream.
     """
     
     def __init__(
@@ -90,6 +116,10 @@ class BaseMLModel(BaseEstimator, TransformerMixin, ABC):
         Returns:
             Tuple of preprocessed X and y
         """
+        # Inputs forwarded by an ensemble have already been preprocessed
+        if getattr(_preprocess_state, 'active', False):
+            return X, y
+        
         # Example preprocessing steps
         # Add your standard preprocessing logic here
         X = np.nan_to_num(X)  # Replace NaN values
@@ -4,7 +4,8 @@ import pandas as pd
 from typing import List, Dict, Any
 from sklearn.ensemble import VotingRegressor, StackingRegressor
 from sklearn.model_selection import train_test_split
-from .base_model import BaseMLModel
+from .base_model import BaseMLModel, preprocessed_input
+from .array_utils import as_float32_contiguous
 
 # Configure logging
 logging.basicConfig(
@@ -95,6 +96,7 @@ class EnsemblePredictor(BaseMLModel):
             test_size (float): Proportion of data for testing
         """
         # Preprocess data
+        X = as_float32_contiguous(X)
         X, y = self.preprocess_data(X, y)
         
         # Split data
@@ -140,8 +142,10 @@ class EnsemblePredictor(BaseMLModel):
             raise ValueError("Ensemble model not trained")
         
         try:
+            X = as_float32_contiguous(X)
             X, _ = self.preprocess_data(X)
-            predictions = self.ensemble_model.predict(X)
+            with preprocessed_input():
+                predictions = self.ensemble_model.predict(X)
             logger.info("Ensemble predictions generated")
             return predictions
         
@@ -161,19 +165,25 @@ class EnsemblePredictor(BaseMLModel):
         """
         # Probabilistic prediction might require individual base model support
         try:
-            X, _ = self.preprocess_data(X)
-            probas = [
-                model.predict_proba(X) 
-                for model in self.base_models 
+            proba_models = [
+                model for model in self.base_models 
                 if hasattr(model, 'predict_proba')
             ]
             
-            # Average probabilities
-            if probas:
-                return np.mean(probas, axis=0)
+            if not proba_models:
+                logger.warning("Probabilistic prediction not supported by base models")
+                return None
+            
+            X, _ = self.preprocess_data(X)
+            
+            # Average probabilities into a single accumulator
+            with preprocessed_input():
+                probas = np.array(proba_models[0].predict_proba(X), dtype=np.float64)
+                for model in proba_models[1:]:
+                    np.add(probas, model.predict_proba(X), out=probas)
             
-            logger.warning("Probabilistic prediction not supported by base models")
-            return None
+            probas *= 1.0 / len(proba_models)
+            return probas
         
         except Exception as e:
             logger.error(f"Probabilistic prediction failed: {e}")
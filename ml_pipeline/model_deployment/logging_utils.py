@@ -0,0 +1,46 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_handlers: Dict[str, QueueHandler] = {}
+_handlers_lock = threading.Lock()
+
+
+def get_queue_handler(log_path: str) -> QueueHandler:
+    """
+    Return a shared non-blocking handler that writes to ``log_path``.
+    
+    Records are only enqueued on the calling thread; a background
+    ``QueueListener`` owns the ``FileHandler`` and performs the actual
+    write, keeping file I/O off the prediction hot path. One queue and
+    listener is created per distinct log file and reused afterwards.
+    
+    Args:
+        log_path (str): Path of the log file
+    
+    Returns:
+        QueueHandler: Handler to attach to a logger
+    """
+    with _handlers_lock:
+        handler = _handlers.get(log_path)
+        if handler is None:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            
+            file_handler = logging.FileHandler(log_path)
+            file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+            
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            atexit.register(listener.stop)
+            
+            handler = QueueHandler(log_queue)
+            _handlers[log_path] = handler
+    
+    return handler
@@ -9,6 +9,9 @@ from tensorflow.keras.layers import Dense, Dropout
 from tensorflow.keras.optimizers import Adam
 from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
 
+from .array_utils import as_float32_contiguous
+from .logging_utils import get_queue_handler
+
 class TensorFlowSportsPredictor:
     """
     A robust TensorFlow predictor for sports prop predictions with comprehensive 
@@ -32,21 +35,23 @@ class TensorFlowSportsPredictor:
         self.logger = logging.getLogger('TensorFlowSportsPredictor')
         self.logger.setLevel(logging.INFO)
         
-        # Create log directory if it doesn't exist
-        os.makedirs(os.path.dirname(log_path), exist_ok=True)
-        
-        # File handler for logging
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
-        self.logger.addHandler(file_handler)
+        # Queue handler for logging; file writes happen on a background thread
+        queue_handler = get_queue_handler(log_path)
+        if queue_handler not in self.logger.handlers:
+            self.logger.addHandler(queue_handler)
         
         # Model configuration
         self.input_shape = input_shape
         self.model_path = model_path
         self.model = None
         
+        # TFLite interpreter used for CPU inference; rebuilt whenever the
+        # Keras model changes
+        self._tflite = None
+        self._tflite_input_index = None
+        self._tflite_output_index = None
+        self._tflite_batch_size = None
+        
         self.logger.info(f"TensorFlow Sports Predictor initialized with {input_shape} input features")
 
     def create_model(
@@ -67,6 +72,7 @@ class TensorFlowSportsPredictor:
             Sequential: Compiled Keras model
         """
         try:
+            self._tflite = None
             self.model = Sequential()
             
             # Input layer
@@ -121,6 +127,10 @@ class TensorFlowSportsPredictor:
         if self.model is None:
             self.create_model()
         
+        X_train = as_float32_contiguous(X_train)
+        if X_val is not None:
+            X_val = as_float32_contiguous(X_val)
+        
         try:
             # Model checkpoint to save best model
             os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
@@ -137,19 +147,42 @@ class TensorFlowSportsPredictor:
                 restore_best_weights=True
             )
             
+            # Input pipeline: cache the tensors once, reshuffle per epoch and
+            # prefetch so batching overlaps with the training step
+            train_ds = (
+                tf.data.Dataset.from_tensor_slices(
+                    (X_train, np.asarray(y_train, dtype=np.float32))
+                )
+                .cache()
+                .shuffle(len(X_train))
+                .batch(batch_size)
+                .prefetch(tf.data.AUTOTUNE)
+            )
+            
             # Validation data handling
-            validation_data = (X_val, y_val) if X_val is not None and y_val is not None else None
+            validation_data = None
+            if X_val is not None and y_val is not None:
+                validation_data = (
+                    tf.data.Dataset.from_tensor_slices(
+                        (X_val, np.asarray(y_val, dtype=np.float32))
+                    )
+                    .batch(batch_size)
+                    .cache()
+                    .prefetch(tf.data.AUTOTUNE)
+                )
             
             # Train the model
             history = self.model.fit(
-                X_train, y_train,
+                train_ds,
                 epochs=epochs,
-                batch_size=batch_size,
                 validation_data=validation_data,
                 callbacks=[checkpoint, early_stop],
                 verbose=1
             )
             
+            # Weights changed, so any exported interpreter is stale
+            self._tflite = None
+            
             # Log training results
             final_accuracy = history.history.get('val_accuracy', [-1])[-1]
             final_loss = history.history.get('val_loss', [-1])[-1]
@@ -191,13 +224,15 @@ class TensorFlowSportsPredictor:
         
         try:
             # Generate predictions
-            probabilities = self.model.predict(X_test)
+            X_test = as_float32_contiguous(X_test)
+            probabilities = self._tflite_predict(X_test)
             binary_predictions = (probabilities > 0.5).astype(int)
             
-            self.logger.info(
-                f"Predictions generated. Total samples: {len(X_test)}, "
-                f"Positive predictions: {np.sum(binary_predictions)}"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Predictions generated. Total samples: {len(X_test)}, "
+                    f"Positive predictions: {np.sum(binary_predictions)}"
+                )
             
             return probabilities, binary_predictions
         
@@ -205,6 +240,60 @@ class TensorFlowSportsPredictor:
             self.logger.error(f"Prediction failed: {e}")
             raise
 
+    def _build_inference_model(self) -> Sequential:
+        """
+        Build an inference-only view of the trained model without Dropout.
+        
+        Dropout is an identity at inference time, so the Dense layers are
+        reused as-is (sharing weights with ``self.model``) and the Dropout
+        layers are skipped to shrink the exported graph.
+        
+        Returns:
+            Sequential: Inference model sharing weights with ``self.model``
+        """
+        inference_model = Sequential(
+            [tf.keras.Input(shape=(self.input_shape,))] + [
+                layer for layer in self.model.layers
+                if not isinstance(layer, Dropout)
+            ]
+        )
+        return inference_model
+
+    def _tflite_predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Run inference through a TFLite interpreter exported from the Keras model.
+        
+        The interpreter (XNNPACK-backed on CPU) is built lazily on first use
+        and its tensors are only reallocated when the batch size changes.
+        
+        Args:
+            X (np.ndarray): float32 input features
+        
+        Returns:
+            np.ndarray: Raw model outputs
+        """
+        if self._tflite is None:
+            converter = tf.lite.TFLiteConverter.from_keras_model(
+                self._build_inference_model()
+            )
+            self._tflite = tf.lite.Interpreter(
+                model_content=converter.convert(),
+                num_threads=os.cpu_count()
+            )
+            self._tflite_input_index = self._tflite.get_input_details()[0]['index']
+            self._tflite_output_index = self._tflite.get_output_details()[0]['index']
+            self._tflite_batch_size = None
+            self.logger.info("TFLite interpreter built for CPU inference")
+        
+        if self._tflite_batch_size != X.shape[0]:
+            self._tflite.resize_tensor_input(self._tflite_input_index, X.shape)
+            self._tflite.allocate_tensors()
+            self._tflite_batch_size = X.shape[0]
+        
+        self._tflite.set_tensor(self._tflite_input_index, X)
+        self._tflite.invoke()
+        return self._tflite.get_tensor(self._tflite_output_index)
+
     def save_model(self, path: Optional[str] = None) -> None:
         """
         Save the trained model to a specified path.
@@ -5,7 +5,10 @@ from typing import Dict, Any, Optional, Tuple, List
 import numpy as np
 import xgboost as xgb
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.model_selection import train_test_split
+
+from .array_utils import as_float32_contiguous
+from .logging_utils import get_queue_handler
 
 class XGBoostSportsPredictor:
     """
@@ -28,19 +31,15 @@ class XGBoostSportsPredictor:
         self.logger = logging.getLogger('XGBoostSportsPredictor')
         self.logger.setLevel(logging.INFO)
         
-        # Create log directory if it doesn't exist
-        os.makedirs(os.path.dirname(log_path), exist_ok=True)
-        
-        # File handler for logging
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
-        self.logger.addHandler(file_handler)
+        # Queue handler for logging; file writes happen on a background thread
+        queue_handler = get_queue_handler(log_path)
+        if queue_handler not in self.logger.handlers:
+            self.logger.addHandler(queue_handler)
         
         # Model configuration
         self.model_path = model_path
         self.model = None
+        self._booster = None
         
         self.logger.info("XGBoost Sports Predictor initialized")
 
@@ -106,6 +105,10 @@ class XGBoostSportsPredictor:
         if self.model is None:
             self.create_model()
         
+        X_train = as_float32_contiguous(X_train)
+        if X_val is not None:
+            X_val = as_float32_contiguous(X_val)
+        
         try:
             # Prepare validation data or split training data
             if X_val is None or y_val is None:
@@ -113,29 +116,55 @@ class XGBoostSportsPredictor:
                     X_train, y_train, test_size=0.2, random_state=42
                 )
             
-            # Perform cross-validation
-            cv_scores = cross_val_score(
-                self.model, X_train, y_train, cv=5, scoring='accuracy'
+            # Perform cross-validation natively on a single DMatrix that
+            # xgb.cv slices into folds; a QuantileDMatrix cannot be sliced,
+            # so training below bins its own copy
+            dtrain = xgb.DMatrix(X_train, label=y_train)
+            cv_params = self.model.get_xgb_params()
+            cv_params['nthread'] = -1
+            cv_results = xgb.cv(
+                cv_params,
+                dtrain,
+                num_boost_round=self.model.n_estimators,
+                nfold=5,
+                metrics='error',
+                early_stopping_rounds=early_stopping_rounds,
+                seed=42,
+                verbose_eval=False
             )
+            cv_error = cv_results['test-error-mean'].iloc[-1]
+            cv_error_std = cv_results['test-error-std'].iloc[-1]
             
-            # Train with early stopping
-            self.model.fit(
-                X_train, y_train,
-                eval_set=[(X_val, y_val)],
+            # Train with early stopping on pre-binned quantile matrices;
+            # the validation set reuses the training quantile cuts
+            params = self.model.get_xgb_params()
+            if not params.get('tree_method'):
+                params['tree_method'] = 'hist'
+            dtrain_binned = xgb.QuantileDMatrix(X_train, label=y_train)
+            dval = xgb.QuantileDMatrix(X_val, label=y_val, ref=dtrain_binned)
+            self._booster = xgb.train(
+                params,
+                dtrain_binned,
+                num_boost_round=self.model.n_estimators,
+                evals=[(dval, 'val')],
                 early_stopping_rounds=early_stopping_rounds,
-                verbose=False
+                verbose_eval=False
             )
             
             # Predict and compute metrics
-            y_pred = self.model.predict(X_val)
+            y_pred = (
+                self._booster.inplace_predict(
+                    X_val, iteration_range=self._iteration_range()
+                ) >= 0.5
+            ).astype(int)
             
             metrics = {
                 'accuracy': accuracy_score(y_val, y_pred),
                 'precision': precision_score(y_val, y_pred),
                 'recall': recall_score(y_val, y_pred),
                 'f1_score': f1_score(y_val, y_pred),
-                'cross_validation_mean_accuracy': np.mean(cv_scores),
-                'cross_validation_std_accuracy': np.std(cv_scores)
+                'cross_validation_mean_accuracy': 1 - cv_error,
+                'cross_validation_std_accuracy': cv_error_std
             }
             
             # Log training results
@@ -165,24 +194,27 @@ class XGBoostSportsPredictor:
         Returns:
             Tuple of raw probabilities and binary predictions
         """
-        if self.model is None:
+        if self._booster is None:
             try:
                 # Attempt to load saved model if not in memory
-                self.model = xgb.XGBClassifier()
-                self.model.load_model(self.model_path)
+                self._booster = self._load_booster(self.model_path)
             except Exception as e:
                 self.logger.error(f"Could not load model: {e}")
                 raise
         
         try:
             # Generate predictions
-            probabilities = self.model.predict_proba(X_test)[:, 1]
+            X_test = as_float32_contiguous(X_test)
+            probabilities = self._booster.inplace_predict(
+                X_test, iteration_range=self._iteration_range()
+            )
             binary_predictions = (probabilities >= probability_threshold).astype(int)
             
-            self.logger.info(
-                f"Predictions generated. Total samples: {len(X_test)}, "
-                f"Positive predictions: {np.sum(binary_predictions)}"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Predictions generated. Total samples: {len(X_test)}, "
+                    f"Positive predictions: {np.sum(binary_predictions)}"
+                )
             
             return probabilities, binary_predictions
         
@@ -190,6 +222,34 @@ class XGBoostSportsPredictor:
             self.logger.error(f"Prediction failed: {e}")
             raise
 
+    @staticmethod
+    def _load_booster(model_path: str) -> xgb.Booster:
+        """
+        Load a booster from a raw UBJSON model file.
+        
+        Args:
+            model_path (str): Path of the saved model
+        
+        Returns:
+            xgb.Booster: Loaded booster
+        """
+        booster = xgb.Booster()
+        with open(model_path, 'rb') as model_file:
+            booster.load_model(bytearray(model_file.read()))
+        return booster
+
+    def _iteration_range(self) -> Tuple[int, int]:
+        """
+        Tree range to predict with, honouring early stopping if it triggered.
+        
+        Returns:
+            Tuple[int, int]: Iteration range for ``inplace_predict``
+        """
+        best_iteration = self._booster.attr('best_iteration')
+        if best_iteration is None:
+            return (0, 0)
+        return (0, int(best_iteration) + 1)
+
     def feature_importance(self) -> List[Tuple[str, float]]:
         """
         Retrieve and log feature importances.
@@ -197,13 +257,20 @@ class XGBoostSportsPredictor:
         Returns:
             List of (feature_name, importance_score) tuples
         """
-        if self.model is None:
+        if self._booster is None:
             self.logger.warning("Model not trained. Cannot retrieve feature importance.")
             return []
         
         try:
-            # Get feature importances
-            importances = self.model.feature_importances_
+            # Get normalised gain importances, matching feature_importances_
+            scores = self._booster.get_score(importance_type='gain')
+            importances = np.array(
+                [scores.get(f"f{i}", 0.0) for i in range(self._booster.num_features())],
+                dtype=np.float32
+            )
+            total = importances.sum()
+            if total > 0:
+                importances /= total
             
             # Assuming feature names could be passed or default index used
             feature_names = [f"Feature_{i}" for i in range(len(importances))]
@@ -236,12 +303,13 @@ class XGBoostSportsPredictor:
         save_path = path or self.model_path
         
         try:
-            if self.model is not None:
+            if self._booster is not None:
                 # Ensure directory exists
                 os.makedirs(os.path.dirname(save_path), exist_ok=True)
                 
-                # Save model
-                self.model.save_model(save_path)
+                # Save model as a raw UBJSON buffer
+                with open(save_path, 'wb') as model_file:
+                    model_file.write(self._booster.save_raw('ubj'))
                 self.logger.info(f"Model saved successfully to {save_path}")
             else:
                 self.logger.warning("No model to save. Train or load a model first.")
@@ -18,6 +18,7 @@ class EnsembleModel(BaseModel):
         return data.values
     
     def train(self, X_train: np.ndarray, y_train: np.ndarray) -> None:
+        X_train = np.ascontiguousarray(X_train, dtype=np.float32)
         for model in self.models:
             model.train(X_train, y_train)
         self.is_trained = all(model.is_trained for model in self.models)
@@ -27,5 +28,10 @@ class EnsembleModel(BaseModel):
             self.logger.error("Ensemble not trained")
             raise RuntimeError("Ensemble not trained")
         
-        predictions = np.column_stack([model.predict(X) for model in self.models])
-        return np.mean(predictions, axis=1)
\ No newline at end of file
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        # Accumulate in place rather than stacking an (n, M) matrix
+        acc = np.zeros(X.shape[0], dtype=np.float32)
+        for model in self.models:
+            np.add(acc, np.ravel(model.predict(X)), out=acc, casting='unsafe')
+        acc *= 1.0 / len(self.models)
+        return acc
\ No newline at end of file
@@ -1,13 +1,107 @@
+import atexit
+import copy
 import os
+import stat
+import tempfile
+import threading
 import yaml
 import logging
-from typing import Dict, Any, Optional, Union
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Union
+
+# Prefer the libyaml-backed C loader/dumper, falling back to pure Python
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Process-wide cache of parsed configuration files keyed on (path, mtime)
+_PARSE_CACHE_MAXSIZE = 64
+_parse_cache: 'OrderedDict[Tuple[str, int], Dict[str, Any]]' = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _parse_config_file(config_path: str) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration file, reusing the result while it is unchanged.
+    
+    Args:
+        config_path (str): Path to the configuration YAML file
+    
+    Returns:
+        Dict[str, Any]: Private copy of the parsed configuration
+    """
+    key = (os.path.abspath(config_path), os.stat(config_path).st_mtime_ns)
+    
+    with _parse_cache_lock:
+        if key in _parse_cache:
+            _parse_cache.move_to_end(key)
+            return copy.deepcopy(_parse_cache[key])
+    
+    with open(config_path, 'r') as config_file:
+        config = yaml.load(config_file, Loader=Loader)
+    
+    with _parse_cache_lock:
+        _parse_cache[key] = config
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > _PARSE_CACHE_MAXSIZE:
+            _parse_cache.popitem(last=False)
+    
+    return copy.deepcopy(config)
+
+
+def _deep_update(target: Dict[str, Any], updates: Dict[str, Any]) -> None:
+    """
+    Merge ``updates`` into ``target`` in place, recursing into nested dicts.
+    
+    Args:
+        target (Dict[str, Any]): Dictionary to update
+        updates (Dict[str, Any]): New values
+    """
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_update(target[key], value)
+        else:
+            target[key] = value
+
+
+def _invalidate_config_file(config_path: str) -> None:
+    """
+    Drop every cached parse of a configuration file.
+    
+    Args:
+        config_path (str): Path to the configuration YAML file
+    """
+    path = os.path.abspath(config_path)
+    with _parse_cache_lock:
+        for key in [key for key in _parse_cache if key[0] == path]:
+            del _parse_cache[key]
 
 class ModelConfiguration:
     """
     Centralized configuration management for machine learning models in the 
     Sports Prop Predictor project.
+    
+    One shared instance exists per configuration file; constructing the class
+    again with the same ``config_path`` returns that instance.
     """
+    __slots__ = ('logger', 'config_path', 'config', '_dirty', '_initialized')
+    
+    _instances: Dict[str, 'ModelConfiguration'] = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(
+        cls, 
+        config_path: str = 'config/model_config.yml',
+        log_path: str = 'logs/model_configuration.log'
+    ):
+        key = os.path.abspath(config_path)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instances[key] = instance
+        return instance
+
     def __init__(
         self, 
         config_path: str = 'config/model_config.yml',
@@ -20,23 +114,33 @@ class ModelConfiguration:
             config_path (str): Path to the configuration YAML file
             log_path (str): Path for logging configuration activities
         """
+        # Shared instance already set up for this configuration file
+        if self._initialized:
+            return
+        
         # Configure logging
         self.logger = logging.getLogger('ModelConfiguration')
         self.logger.setLevel(logging.INFO)
         
-        # Ensure log directory exists
-        os.makedirs(os.path.dirname(log_path), exist_ok=True)
-        
-        # File handler for logging
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
-        self.logger.addHandler(file_handler)
+        if not self.logger.handlers:
+            # Ensure log directory exists
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            
+            # File handler for logging
+            file_handler = logging.FileHandler(log_path)
+            file_handler.setFormatter(logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            ))
+            self.logger.addHandler(file_handler)
         
         # Configuration management
         self.config_path = config_path
         self.config = self._load_configuration()
+        
+        # Updates are batched in memory and written by flush()
+        self._dirty = False
+        atexit.register(self.flush)
+        self._initialized = True
 
     def _load_configuration(self) -> Dict[str, Any]:
         """
@@ -53,9 +157,8 @@ class ModelConfiguration:
             if not os.path.exists(self.config_path):
                 self._create_default_configuration()
             
-            # Load configuration
-            with open(self.config_path, 'r') as config_file:
-                config = yaml.safe_load(config_file)
+            # Load configuration (cached until the file changes)
+            config = _parse_config_file(self.config_path)
             
             self.logger.info(f"Configuration loaded from {self.config_path}")
             return config
@@ -107,8 +210,7 @@ class ModelConfiguration:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             
             # Write default configuration
-            with open(self.config_path, 'w') as config_file:
-                yaml.dump(default_config, config_file, default_flow_style=False)
+            self._write_configuration(default_config)
             
             self.logger.info(f"Default configuration created at {self.config_path}")
         
@@ -153,6 +255,9 @@ class ModelConfiguration:
         """
         Update configuration with new settings.
         
+        Changes are applied in memory and persisted on ``flush()``, which
+        also runs automatically at interpreter exit.
+        
         Args:
             updates (Dict[str, Any]): Configuration updates
             model_type (Optional[str]): Specific model type to update
@@ -160,24 +265,76 @@ class ModelConfiguration:
         try:
             # If no specific model type, update entire configuration
             if model_type is None:
-                self.config.update(updates)
+                _deep_update(self.config, updates)
             else:
                 # Update specific model configuration
                 model_key = f"{model_type.lower()}_model"
                 if model_key in self.config:
-                    self.config[model_key].update(updates)
+                    _deep_update(self.config[model_key], updates)
                 else:
                     raise KeyError(f"Model type {model_type} not found in configuration")
             
-            # Save updated configuration
-            with open(self.config_path, 'w') as config_file:
-                yaml.dump(self.config, config_file, default_flow_style=False)
+            self._dirty = True
             
             self.logger.info(f"Configuration updated for {model_type or 'all models'}")
         
         except Exception as e:
             self.logger.error(f"Configuration update failed: {e}")
 
+    def flush(self) -> None:
+        """
+        Persist pending configuration updates, if any.
+        """
+        if not self._dirty:
+            return
+        
+        try:
+            self._write_configuration(self.config)
+            self._dirty = False
+            self.logger.info(f"Configuration saved to {self.config_path}")
+        
+        except Exception as e:
+            self.logger.error(f"Configuration save failed: {e}")
+
+    def _write_configuration(self, config: Dict[str, Any]) -> None:
+        """
+        Atomically write a configuration to the YAML file.
+        
+        The YAML is written to a temporary file in the same directory and
+        renamed over the target, so readers never see a partial file. The
+        file keeps the target's permissions (the umask default for a new
+        file) rather than the temporary file's 0600.
+        
+        Args:
+            config (Dict[str, Any]): Configuration to write
+        """
+        config_dir = os.path.dirname(self.config_path) or '.'
+        try:
+            mode = stat.S_IMODE(os.stat(self.config_path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        
+        with tempfile.NamedTemporaryFile(
+            'w', dir=config_dir, suffix='.tmp', delete=False
+        ) as tmp_file:
+            try:
+                yaml.dump(config, tmp_file, Dumper=Dumper, default_flow_style=False)
+                os.fchmod(tmp_file.fileno(), mode)
+            except BaseException:
+                tmp_file.close()
+                os.unlink(tmp_file.name)
+                raise
+        
+        try:
+            os.replace(tmp_file.name, self.config_path)
+        except OSError:
+            os.unlink(tmp_file.name)
+            raise
+        
+        _invalidate_config_file(self.config_path)
+
     def get_model_path(
         self, 
         model_type: str = 'tensorflow'
@@ -7,14 +7,30 @@ from .base_model import BaseModel
 class XGBoostPredictor(BaseModel):
     def __init__(self, model_name='xgboost_predictor', config=None):
         super().__init__(model_name, config or {})
-        self.model = xgb.XGBRegressor()  # Default configuration
+        
+        # Histogram tree method on all cores; the 'xgboost_model' section of
+        # the model configuration overrides these (e.g. device='cuda')
+        params = {
+            'tree_method': 'hist',
+            'device': 'cpu',
+            'n_jobs': -1,
+            'max_bin': 256,
+            **(config or {}).get('xgboost_model', {})
+        }
+        self.model = xgb.XGBRegressor(**params)
     
     def preprocess(self, data: pd.DataFrame) -> np.ndarray:
         # Implement XGBoost-specific preprocessing
-        return data.values
+        non_numeric = data.select_dtypes(exclude=[np.number, 'bool']).columns
+        if len(non_numeric):
+            raise ValueError(f"Non-numeric feature columns: {list(non_numeric)}")
+        # float32 C-contiguous buffer that QuantileDMatrix/inplace_predict use as-is
+        return np.ascontiguousarray(data.to_numpy(dtype=np.float32, copy=False))
     
     def train(self, X_train: np.ndarray, y_train: np.ndarray) -> None:
         try:
+            # With tree_method='hist' the estimator bins the inputs into a
+            # QuantileDMatrix with the configured max_bin
             self.model.fit(X_train, y_train)
             self.is_trained = True
             self.logger.info("XGBoost model trained successfully")
@@ -1,145 +1,218 @@
+import json
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, List
-from sklearn.preprocessing import LabelEncoder
+from joblib import Parallel, delayed
 from fairlearn.metrics import (
-    demographic_parity_difference,
-    equalized_odds_difference,
-    disparate_impact
+    MetricFrame,
+    selection_rate,
+    true_positive_rate,
+    false_positive_rate
 )
 
-class BiasDetector:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def detect_demographic_bias(
+    y_true: np.ndarray, 
+    y_pred: np.ndarray, 
+    sensitive_features: pd.DataFrame
+) -> Dict[str, float]:
     """
-    Comprehensive bias detection and mitigation for machine learning models
-    in the Sports Prop Predictor project.
+    Detect bias across different demographic groups.
+    
+    Args:
+        y_true (np.ndarray): True target values
+        y_pred (np.ndarray): Predicted target values
+        sensitive_features (pd.DataFrame): DataFrame with sensitive attribute columns
+    
+    Returns:
+        Dict[str, float]: Bias metrics for each sensitive attribute
     """
+    # Quantile-bin continuous attributes once so that every distinct
+    # float value is not treated as its own group (NaN gets bin -1);
+    # low-cardinality floats such as 0.0/1.0 flags keep their raw values
+    continuous = [
+        column for column in sensitive_features.select_dtypes(include=[np.floating]).columns
+        if sensitive_features[column].nunique() > 10
+    ]
+    if len(continuous):
+        sensitive_features = sensitive_features.assign(**{
+            column: pd.qcut(
+                sensitive_features[column], q=10, labels=False, duplicates='drop'
+            ).fillna(-1).astype(np.int8)
+            for column in continuous
+        })
     
-    @staticmethod
-    def detect_demographic_bias(
-        y_true: np.ndarray, 
-        y_pred: np.ndarray, 
-        sensitive_features: pd.DataFrame
-    ) -> Dict[str, float]:
-        """
-        Detect bias across different demographic groups.
-        
-        Args:
-            y_true (np.ndarray): True target values
-            y_pred (np.ndarray): Predicted target values
-            sensitive_features (pd.DataFrame): DataFrame with sensitive attribute columns
-        
-        Returns:
-            Dict[str, float]: Bias metrics for each sensitive attribute
-        """
-        bias_results = {}
-        
-        for column in sensitive_features.columns:
-            # Convert sensitive feature to numeric if categorical
-            if sensitive_features[column].dtype == 'object':
-                le = LabelEncoder()
-                feature_numeric = le.fit_transform(sensitive_features[column])
-            else:
-                feature_numeric = sensitive_features[column]
-            
-            bias_results[column] = {
-                'demographic_parity_diff': demographic_parity_difference(
-                    y_true, y_pred, sensitive_features=feature_numeric
-                ),
-                'equalized_odds_diff': equalized_odds_difference(
-                    y_true, y_pred, sensitive_features=feature_numeric
-                ),
-                'disparate_impact': disparate_impact(
-                    y_true, y_pred, sensitive_features=feature_numeric
-                )
-            }
-        
-        return bias_results
-    
-    @staticmethod
-    def detect_prediction_bias(
-        y_true: np.ndarray, 
-        y_pred: np.ndarray, 
-        sensitive_features: pd.DataFrame
-    ) -> Dict[str, Dict[str, float]]:
-        """
-        Detect prediction biases across different groups.
-        
-        Args:
-            y_true (np.ndarray): True target values
-            y_pred (np.ndarray): Predicted target values
-            sensitive_features (pd.DataFrame): DataFrame with sensitive attribute columns
+    # Shared contiguous label buffers reused by every column's metrics;
+    # integer labels are widened (never narrowed) and float scores are
+    # passed through uncast
+    y_true = np.ascontiguousarray(y_true)
+    y_pred = np.ascontiguousarray(y_pred)
+    if y_true.dtype.kind in 'iu':
+        y_true = y_true.astype(np.int64, copy=False)
+    if y_pred.dtype.kind in 'iu':
+        y_pred = y_pred.astype(np.int64, copy=False)
+    
+    def _metrics_for(column: str) -> Dict[str, float]:
+        # Convert sensitive feature to numeric if categorical
+        if sensitive_features[column].dtype == 'object':
+            feature_numeric, _ = pd.factorize(
+                sensitive_features[column].values, sort=False
+            )
+        else:
+            feature_numeric = sensitive_features[column]
         
-        Returns:
-            Dict[str, Dict[str, float]]: Detailed prediction bias metrics
-        """
-        from sklearn.metrics import precision_score, recall_score
+        # One grouped pass yields every per-group rate the three metrics need
+        metric_frame = MetricFrame(
+            metrics={
+                'selection_rate': selection_rate,
+                'tpr': true_positive_rate,
+                'fpr': false_positive_rate
+            },
+            y_true=y_true,
+            y_pred=y_pred,
+            sensitive_features=feature_numeric
+        )
+        diffs = metric_frame.difference(method='between_groups')
+        selection_rates = metric_frame.by_group['selection_rate']
         
-        bias_analysis = {}
+        return {
+            'demographic_parity_diff': diffs['selection_rate'],
+            'equalized_odds_diff': max(diffs['tpr'], diffs['fpr']),
+            'disparate_impact': selection_rates.min() / max(selection_rates.max(), 1e-12)
+        }
+    
+    columns = list(sensitive_features.columns)
+    results = Parallel(n_jobs=-1, prefer='threads')(
+        delayed(_metrics_for)(column) for column in columns
+    )
+    
+    return dict(zip(columns, results))
+
+
+def detect_prediction_bias(
+    y_true: np.ndarray, 
+    y_pred: np.ndarray, 
+    sensitive_features: pd.DataFrame
+) -> Dict[str, Dict[str, float]]:
+    """
+    Detect prediction biases across different groups.
+    
+    Args:
+        y_true (np.ndarray): True target values
+        y_pred (np.ndarray): Predicted target values
+        sensitive_features (pd.DataFrame): DataFrame with sensitive attribute columns
+    
+    Returns:
+        Dict[str, Dict[str, float]]: Detailed prediction bias metrics
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    
+    # Flattened confusion-matrix cell of each sample: 2 * actual + predicted
+    cells = 2 * (y_true == 1).astype(np.int64) + (y_pred == 1)
+    
+    bias_analysis = {}
+    
+    for column in sensitive_features.columns:
+        codes, groups = pd.factorize(
+            sensitive_features[column].values, sort=False, use_na_sentinel=False
+        )
         
-        for column in sensitive_features.columns:
-            unique_groups = sensitive_features[column].unique()
-            
-            group_metrics = {}
-            for group in unique_groups:
-                group_mask = sensitive_features[column] == group
-                
-                group_metrics[str(group)] = {
-                    'precision': precision_score(
-                        y_true[group_mask], 
-                        y_pred[group_mask], 
-                        zero_division=0
-                    ),
-                    'recall': recall_score(
-                        y_true[group_mask], 
-                        y_pred[group_mask], 
-                        zero_division=0
-                    ),
-                    'group_representation': group_mask.sum() / len(group_mask)
-                }
-            
-            bias_analysis[column] = group_metrics
+        # One scatter pass builds every group's 2x2 confusion matrix
+        counts = np.bincount(
+            4 * codes + cells, minlength=4 * len(groups)
+        ).reshape(len(groups), 2, 2)
         
-        return bias_analysis
-    
-    @classmethod
-    def generate_bias_report(
-        cls, 
-        y_true: np.ndarray, 
-        y_pred: np.ndarray, 
-        sensitive_features: pd.DataFrame,
-        report_path: str = None
-    ) -> Dict[str, Any]:
-        """
-        Generate a comprehensive bias detection report.
+        tp = counts[:, 1, 1].astype(np.float64)
+        predicted_positive = tp + counts[:, 0, 1]
+        actual_positive = tp + counts[:, 1, 0]
         
-        Args:
-            y_true (np.ndarray): True target values
-            y_pred (np.ndarray): Predicted target values
-            sensitive_features (pd.DataFrame): DataFrame with sensitive attribute columns
-            report_path (str, optional): Path to save the report
+        precision = np.divide(
+            tp, predicted_positive,
+            out=np.zeros_like(tp), where=predicted_positive > 0
+        )
+        recall = np.divide(
+            tp, actual_positive,
+            out=np.zeros_like(tp), where=actual_positive > 0
+        )
+        representation = counts.reshape(len(groups), -1).sum(axis=1) / len(cells)
         
-        Returns:
-            Dict[str, Any]: Comprehensive bias detection report
-        """
-        report = {
-            'demographic_bias': cls.detect_demographic_bias(y_true, y_pred, sensitive_features),
-            'prediction_bias': cls.detect_prediction_bias(y_true, y_pred, sensitive_features)
+        bias_analysis[column] = {
+            str(group): {
+                'precision': precision[i],
+                'recall': recall[i],
+                'group_representation': representation[i]
+            }
+            for i, group in enumerate(groups)
         }
-        
-        if report_path:
-            cls._save_report(report, report_path)
-        
-        return report
     
-    @staticmethod
-    def _save_report(report: Dict[str, Any], path: str) -> None:
-        """
-        Save bias detection report to a file.
-        
-        Args:
-            report (Dict[str, Any]): Bias detection report dictionary
-            path (str): File path to save the report
-        """
+    return bias_analysis
+
+
+def generate_bias_report(
+    y_true: np.ndarray, 
+    y_pred: np.ndarray, 
+    sensitive_features: pd.DataFrame,
+    report_path: str = None
+) -> Dict[str, Any]:
+    """
+    Generate a comprehensive bias detection report.
+    
+    Args:
+        y_true (np.ndarray): True target values
+        y_pred (np.ndarray): Predicted target values
+        sensitive_features (pd.DataFrame): DataFrame with sensitive attribute columns
+        report_path (str, optional): Path to save the report
+    
+    Returns:
+        Dict[str, Any]: Comprehensive bias detection report
+    """
+    report = {
+        'demographic_bias': detect_demographic_bias(y_true, y_pred, sensitive_features),
+        'prediction_bias': detect_prediction_bias(y_true, y_pred, sensitive_features)
+    }
+    
+    if report_path:
+        _save_report(report, report_path)
+    
+    return report
+
+
+def _save_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Save bias detection report to a file.
+    
+    Args:
+        report (Dict[str, Any]): Bias detection report dictionary
+        path (str): File path to save the report
+    """
+    if orjson is not None:
+        # Native NumPy scalar support, so fairlearn outputs need no casting
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
         with open(path, 'w') as f:
-            import json
-            json.dump(report, f, indent=4)
\ No newline at end of file
+            json.dump(report, f, indent=4)
+
+
+class BiasDetector:
+    """
+    Comprehensive bias detection and mitigation for machine learning models
+    in the Sports Prop Predictor project.
+    """
+    # Thin stateless wrapper kept for API compatibility; the module-level
+    # functions above hold the implementation
+    __slots__ = ()
+    
+    detect_demographic_bias = staticmethod(detect_demographic_bias)
+    detect_prediction_bias = staticmethod(detect_prediction_bias)
+    generate_bias_report = staticmethod(generate_bias_report)
+    _save_report = staticmethod(_save_report)
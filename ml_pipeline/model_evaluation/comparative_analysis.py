@@ -1,228 +1,357 @@
+import json
+import os
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-from typing import Dict, List, Any, Callable
-from sklearn.model_selection import cross_val_score
+from typing import TYPE_CHECKING, Dict, List, Any, Callable, Tuple
+from joblib import Parallel, delayed, parallel_backend
+from sklearn.model_selection import KFold, cross_validate
 from sklearn.metrics import (
     mean_squared_error, 
     mean_absolute_error, 
     r2_score
 )
 
-class ComparativeModelAnalysis:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+def _cv_splits(X: np.ndarray, n_splits: int) -> List[Tuple[np.ndarray, np.ndarray]]:
     """
-    Comprehensive model comparison and analysis for 
-    the Sports Prop Predictor project.
+    K-fold train/test indices shared by every cross-validated comparison.
+    
+    Unshuffled, matching the folds ``cross_val_score(cv=n_splits)`` uses for
+    regressors, so all entry points report the same CV numbers.
+    
+    Args:
+        X (np.ndarray): Feature matrix
+        n_splits (int): Number of folds
+    
+    Returns:
+        List[Tuple[np.ndarray, np.ndarray]]: Train and test indices per fold
+    """
+    return list(KFold(n_splits=n_splits).split(X))
+
+
+def cross_validation_comparison(
+    models: Dict[str, Any], 
+    X: np.ndarray, 
+    y: np.ndarray, 
+    cv: int = 5
+) -> Dict[str, Dict[str, float]]:
     """
+    Perform cross-validation comparison across multiple models.
     
-    @staticmethod
-    def cross_validation_comparison(
-        models: Dict[str, Any], 
-        X: np.ndarray, 
-        y: np.ndarray, 
-        cv: int = 5
-    ) -> Dict[str, Dict[str, float]]:
-        """
-        Perform cross-validation comparison across multiple models.
-        
-        Args:
-            models (Dict[str, Any]): Dictionary of models to compare
-            X (np.ndarray): Feature matrix
-            y (np.ndarray): Target values
-            cv (int, optional): Number of cross-validation folds
-        
-        Returns:
-            Dict[str, Dict[str, float]]: Cross-validation performance metrics
-        """
-        cv_results = {}
-        
-        for name, model in models.items():
-            # Perform cross-validation
-            mse_scores = cross_val_score(
-                model, 
-                X, 
-                y, 
-                cv=cv, 
-                scoring='neg_mean_squared_error'
-            )
-            
-            r2_scores = cross_val_score(
-                model, 
-                X, 
-                y, 
-                cv=cv, 
-                scoring='r2'
-            )
-            
-            cv_results[name] = {
-                'mean_cv_mse': -mse_scores.mean(),
-                'std_cv_mse': mse_scores.std(),
-                'mean_cv_r2': r2_scores.mean(),
-                'std_cv_r2': r2_scores.std()
-            }
-        
-        return cv_results
-    
-    @staticmethod
-    def performance_comparison(
-        models: Dict[str, Any], 
-        X_train: np.ndarray, 
-        X_test: np.ndarray, 
-        y_train: np.ndarray, 
-        y_test: np.ndarray
-    ) -> Dict[str, Dict[str, float]]:
-        """
-        Compare model performance on test data.
-        
-        Args:
-            models (Dict[str, Any]): Dictionary of models to compare
-            X_train (np.ndarray): Training feature matrix
-            X_test (np.ndarray): Testing feature matrix
-            y_train (np.ndarray): Training target values
-            y_test (np.ndarray): Testing target values
-        
-        Returns:
-            Dict[str, Dict[str, float]]: Performance metrics for each model
-        """
-        performance_results = {}
-        
-        for name, model in models.items():
-            # Train the model
-            model.fit(X_train, y_train)
-            
-            # Make predictions
-            y_pred = model.predict(X_test)
-            
-            # Calculate metrics
-            performance_results[name] = {
-                'mean_squared_error': mean_squared_error(y_test, y_pred),
-                'mean_absolute_error': mean_absolute_error(y_test, y_pred),
-                'r2_score': r2_score(y_test, y_pred)
-            }
-        
-        return performance_results
-    
-    @staticmethod
-    def generate_performance_comparison_plot(
-        performance_results: Dict[str, Dict[str, float]]
-    ) -> go.Figure:
-        """
-        Generate an interactive bar plot comparing model performances.
-        
-        Args:
-            performance_results (Dict[str, Dict[str, float]]): Performance metrics
-        
-        Returns:
-            go.Figure: Interactive comparison plot
-        """
-        # Prepare data for plotting
-        models = list(performance_results.keys())
-        mse_values = [results['mean_squared_error'] for results in performance_results.values()]
-        mae_values = [results['mean_absolute_error'] for results in performance_results.values()]
-        r2_values = [results['r2_score'] for results in performance_results.values()]
-        
-        # Create subplot figure
-        fig = go.Figure()
-        
-        # MSE Bars
-        fig.add_trace(go.Bar(
-            x=models,
-            y=mse_values,
-            name='Mean Squared Error',
-            marker_color='blue'
-        ))
-        
-        # MAE Bars
-        fig.add_trace(go.Bar(
-            x=models,
-            y=mae_values,
-            name='Mean Absolute Error',
-            marker_color='green'
-        ))
-        
-        # R2 Line
-        fig.add_trace(go.Scatter(
-            x=models,
-            y=r2_values,
-            name='R2 Score',
-            mode='lines+markers',
-            marker_color='red',
-            yaxis='y2'
-        ))
-        
-        # Update layout
-        fig.update_layout(
-            title='Model Performance Comparison',
-            xaxis_title='Models',
-            yaxis_title='Error Metrics',
-            yaxis2=dict(
-                title='R2 Score',
-                overlaying='y',
-                side='right'
-            ),
-            barmode='group',
-            height=600,
-            width=800
+    Args:
+        models (Dict[str, Any]): Dictionary of models to compare
+        X (np.ndarray): Feature matrix
+        y (np.ndarray): Target values
+        cv (int, optional): Number of cross-validation folds
+    
+    Returns:
+        Dict[str, Dict[str, float]]: Cross-validation performance metrics
+    """
+    cv_results = {}
+    
+    # Cast once and generate the folds once so every model reuses them
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    splits = _cv_splits(X, cv)
+    
+    for name, model in models.items():
+        # Perform cross-validation, scoring both metrics from one fit per fold
+        scores = cross_validate(
+            model, 
+            X, 
+            y, 
+            cv=splits, 
+            scoring=['neg_mean_squared_error', 'r2'],
+            n_jobs=-1,
+            pre_dispatch='2*n_jobs'
         )
         
-        return fig
-    
-    @classmethod
-    def comprehensive_model_comparison(
-        cls,
-        models: Dict[str, Any], 
-        X: np.ndarray, 
-        y: np.ndarray, 
-        test_size: float = 0.2,
-        random_state: int = 42,
-        report_path: str = None
-    ) -> Dict[str, Any]:
-        """
-        Perform a comprehensive comparison of multiple models.
-        
-        Args:
-            models (Dict[str, Any]): Dictionary of models to compare
-            X (np.ndarray): Feature matrix
-            y (np.ndarray): Target values
-            test_size (float, optional): Proportion of test set
-            random_state (int, optional): Random seed for reproducibility
-            report_path (str, optional): Path to save the report
-        
-        Returns:
-            Dict[str, Any]: Comprehensive model comparison report
-        """
-        from sklearn.model_selection import train_test_split
-        
-        # Split the data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, 
-            test_size=test_size, 
-            random_state=random_state
+        cv_results[name] = _summarize_cv_scores(
+            scores['test_neg_mean_squared_error'],
+            scores['test_r2']
         )
-        
-        # Perform cross-validation comparison
-        cv_results = cls.cross_validation_comparison(models, X, y)
-        
-        # Perform performance comparison on test set
-        performance_results = cls.performance_comparison(
-            models, X_train, X_test, y_train, y_test
+    
+    return cv_results
+
+
+def _summarize_cv_scores(
+    mse_scores: np.ndarray, 
+    r2_scores: np.ndarray
+) -> Dict[str, float]:
+    """
+    Summarize per-fold scores into mean/std cross-validation metrics.
+    
+    Args:
+        mse_scores (np.ndarray): Per-fold negated mean squared errors
+        r2_scores (np.ndarray): Per-fold R2 scores
+    
+    Returns:
+        Dict[str, float]: Cross-validation summary metrics
+    """
+    return {
+        'mean_cv_mse': -mse_scores.mean(),
+        'std_cv_mse': mse_scores.std(),
+        'mean_cv_r2': r2_scores.mean(),
+        'std_cv_r2': r2_scores.std()
+    }
+
+
+def performance_comparison(
+    models: Dict[str, Any], 
+    X_train: np.ndarray, 
+    X_test: np.ndarray, 
+    y_train: np.ndarray, 
+    y_test: np.ndarray
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare model performance on test data.
+    
+    Args:
+        models (Dict[str, Any]): Dictionary of models to compare
+        X_train (np.ndarray): Training feature matrix
+        X_test (np.ndarray): Testing feature matrix
+        y_train (np.ndarray): Training target values
+        y_test (np.ndarray): Testing target values
+    
+    Returns:
+        Dict[str, Dict[str, float]]: Performance metrics for each model
+    """
+    if not models:
+        return {}
+    
+    # One model per worker; cap each worker's native thread pools at one
+    # thread so estimators do not oversubscribe the cores
+    n_jobs = min(len(models), os.cpu_count() or 1)
+    with parallel_backend('loky', inner_max_num_threads=1):
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_fit_and_evaluate)(name, model, X_train, X_test, y_train, y_test)
+            for name, model in models.items()
         )
+    
+    return dict(results)
+
+
+def _fit_and_evaluate(
+    name: str, 
+    model: Any, 
+    X_train: np.ndarray, 
+    X_test: np.ndarray, 
+    y_train: np.ndarray, 
+    y_test: np.ndarray
+) -> Tuple[str, Dict[str, float]]:
+    """
+    Train a single model and score it on the test data.
+    
+    Args:
+        name (str): Model name
+        model (Any): Model to train
+        X_train (np.ndarray): Training feature matrix
+        X_test (np.ndarray): Testing feature matrix
+        y_train (np.ndarray): Training target values
+        y_test (np.ndarray): Testing target values
+    
+    Returns:
+        Tuple[str, Dict[str, float]]: Model name and its performance metrics
+    """
+    # Train the model
+    model.fit(X_train, y_train)
+    
+    # Make predictions
+    y_pred = model.predict(X_test)
+    
+    # Calculate metrics
+    return name, {
+        'mean_squared_error': mean_squared_error(y_test, y_pred),
+        'mean_absolute_error': mean_absolute_error(y_test, y_pred),
+        'r2_score': r2_score(y_test, y_pred)
+    }
+
+
+def generate_performance_comparison_plot(
+    performance_results: Dict[str, Dict[str, float]]
+) -> 'go.Figure':
+    """
+    Generate an interactive bar plot comparing model performances.
+    
+    Args:
+        performance_results (Dict[str, Dict[str, float]]): Performance metrics
+    
+    Returns:
+        go.Figure: Interactive comparison plot
+    """
+    # Plotly is only needed here, so keep it off the import path
+    import plotly.graph_objects as go
+    
+    # Prepare data for plotting
+    models = list(performance_results.keys())
+    mse_values = [results['mean_squared_error'] for results in performance_results.values()]
+    mae_values = [results['mean_absolute_error'] for results in performance_results.values()]
+    r2_values = [results['r2_score'] for results in performance_results.values()]
+    
+    # Create subplot figure
+    fig = go.Figure()
+    
+    # MSE Bars
+    fig.add_trace(go.Bar(
+        x=models,
+        y=mse_values,
+        name='Mean Squared Error',
+        marker_color='blue'
+    ))
+    
+    # MAE Bars
+    fig.add_trace(go.Bar(
+        x=models,
+        y=mae_values,
+        name='Mean Absolute Error',
+        marker_color='green'
+    ))
+    
+    # R2 Line
+    fig.add_trace(go.Scatter(
+        x=models,
+        y=r2_values,
+        name='R2 Score',
+        mode='lines+markers',
+        marker_color='red',
+        yaxis='y2'
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        title='Model Performance Comparison',
+        xaxis_title='Models',
+        yaxis_title='Error Metrics',
+        yaxis2=dict(
+            title='R2 Score',
+            overlaying='y',
+            side='right'
+        ),
+        barmode='group',
+        height=600,
+        width=800
+    )
+    
+    return fig
+
+
+def comprehensive_model_comparison(
+    models: Dict[str, Any], 
+    X: np.ndarray, 
+    y: np.ndarray, 
+    test_size: float = 0.2,
+    random_state: int = 42,
+    report_path: str = None
+) -> Dict[str, Any]:
+    """
+    Perform a comprehensive comparison of multiple models.
+    
+    Args:
+        models (Dict[str, Any]): Dictionary of models to compare
+        X (np.ndarray): Feature matrix
+        y (np.ndarray): Target values
+        test_size (float, optional): Proportion of test set
+        random_state (int, optional): Random seed for reproducibility
+        report_path (str, optional): Path to save the report
+    
+    Returns:
+        Dict[str, Any]: Comprehensive model comparison report
+    """
+    from sklearn.model_selection import train_test_split
+    
+    # Split the data; the held-out split is appended to the CV folds so a
+    # single cross_validate call per model yields both CV and test scores
+    train_idx, test_idx = train_test_split(
+        np.arange(len(X)), 
+        test_size=test_size, 
+        random_state=random_state
+    )
+    splits = _cv_splits(X, 5) + [(train_idx, test_idx)]
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    
+    cv_results = {}
+    performance_results = {}
+    
+    for name, model in models.items():
+        scores = cross_validate(
+            model, 
+            X, 
+            y, 
+            cv=splits, 
+            scoring=['neg_mean_squared_error', 'neg_mean_absolute_error', 'r2'],
+            n_jobs=-1,
+            pre_dispatch='2*n_jobs'
+        )
+        mse_scores = scores['test_neg_mean_squared_error']
+        mae_scores = scores['test_neg_mean_absolute_error']
+        r2_scores = scores['test_r2']
         
-        # Generate comparison report
-        report = {
-            'cross_validation_results': cv_results,
-            'test_performance_results': performance_results
-        }
-        
-        # Generate and save performance plot
-        performance_plot = cls.generate_performance_comparison_plot(performance_results)
-        performance_plot.write_html(report_path + '_performance_plot.html') if report_path else None
-        
-        # Save report if path provided
-        if report_path:
-            import json
-            with open(report_path, 'w') as f:
-                json.dump(report, f, indent=4)
+        # Cross-validation comparison from the K-fold entries
+        cv_results[name] = _summarize_cv_scores(mse_scores[:-1], r2_scores[:-1])
         
-        return report
\ No newline at end of file
+        # Performance comparison on test set from the held-out entry
+        performance_results[name] = {
+            'mean_squared_error': -mse_scores[-1],
+            'mean_absolute_error': -mae_scores[-1],
+            'r2_score': r2_scores[-1]
+        }
+    
+    # Generate comparison report
+    report = {
+        'cross_validation_results': cv_results,
+        'test_performance_results': performance_results
+    }
+    
+    # Generate and save performance plot
+    performance_plot = generate_performance_comparison_plot(performance_results)
+    performance_plot.write_html(report_path + '_performance_plot.html') if report_path else None
+    
+    # Save report if path provided
+    if report_path:
+        _save_report(report, report_path)
+    
+    return report
+
+
+def _save_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Save model comparison report to a file.
+    
+    Args:
+        report (Dict[str, Any]): Model comparison report dictionary
+        path (str): File path to save the report
+    """
+    if orjson is not None:
+        # Native NumPy scalar support, so metric values need no casting
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=4)
+
+
+class ComparativeModelAnalysis:
+    """
+    Comprehensive model comparison and analysis for 
+    the Sports Prop Predictor project.
+    """
+    # Thin stateless wrapper kept for API compatibility; the module-level
+    # functions above hold the implementation
+    __slots__ = ()
+    
+    cross_validation_comparison = staticmethod(cross_validation_comparison)
+    performance_comparison = staticmethod(performance_comparison)
+    generate_performance_comparison_plot = staticmethod(generate_performance_comparison_plot)
+    comprehensive_model_comparison = staticmethod(comprehensive_model_comparison)
+    _summarize_cv_scores = staticmethod(_summarize_cv_scores)
+    _save_report = staticmethod(_save_report)
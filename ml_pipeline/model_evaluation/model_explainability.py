@@ -3,20 +3,48 @@ import pandas as pd
 import shap
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, Any, List
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 from sklearn.inspection import permutation_importance
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ModelExplainability:
     """
     Comprehensive model explainability techniques for 
     the Sports Prop Predictor project.
     """
     
+    # Rows per SHAP call; GPU chunks are larger but still bound device memory
+    SHAP_CHUNK_ROWS = 8192
+    GPU_CHUNK_ROWS = 100_000
+    
+    # Rows subsampled for each permutation importance scoring pass
+    PERMUTATION_MAX_SAMPLES = 10_000
+    
+    # Rows drawn into the SHAP summary plot
+    SUMMARY_PLOT_MAX_ROWS = 1000
+    
+    # Upper bound on rows scored per partial dependence predict call
+    PDP_MAX_BATCH_ROWS = 1_000_000
+    
+    # Recently built explainers keyed by model identity and background
+    # fingerprint; entries also pin the model and its fitted state
+    EXPLAINER_CACHE_SIZE = 8
+    _explainer_cache: 'OrderedDict[Tuple, Tuple[Any, Tuple, Any, str]]' = OrderedDict()
+    
     @staticmethod
     def shap_feature_importance(
         model, 
         X: np.ndarray, 
-        feature_names: List[str] = None
+        feature_names: List[str] = None,
+        device: str = 'auto',
+        background: np.ndarray = None,
+        generate_plot: bool = False
     ) -> Dict[str, Any]:
         """
         Calculate SHAP (SHapley Additive exPlanations) feature importance.
@@ -25,44 +53,284 @@ class ModelExplainability:
             model: Trained machine learning model
             X (np.ndarray): Feature matrix
             feature_names (List[str], optional): Names of features
+            device (str, optional): 'auto' to use the GPU for tree models when
+                CUDA is available, 'cuda' to request it, 'cpu' to disable it
+            background (np.ndarray, optional): Background rows for non-tree
+                models; defaults to a 100-row sample of X
+            generate_plot (bool, optional): Also render the SHAP summary plot
+                for a sample of at most ``SUMMARY_PLOT_MAX_ROWS`` rows
         
         Returns:
             Dict[str, Any]: SHAP feature importance analysis
         """
-        # Use TreeExplainer for tree-based models, KernelExplainer for others
-        if hasattr(model, 'predict_proba'):
-            explainer = shap.TreeExplainer(model)
-        else:
-            explainer = shap.KernelExplainer(model.predict, X)
+        explainer, kind = ModelExplainability._get_explainer(model, X, device, background)
         
-        shap_values = explainer.shap_values(X)
+        chunk = (
+            ModelExplainability.GPU_CHUNK_ROWS if kind == 'gpu_tree' 
+            else ModelExplainability.SHAP_CHUNK_ROWS
+        )
         
-        return {
-            'mean_abs_shap': np.abs(shap_values).mean(axis=0).tolist(),
-            'feature_names': feature_names or [f'Feature_{i}' for i in range(X.shape[1])],
-            'shap_summary_plot': shap.summary_plot(
-                shap_values, 
-                X, 
+        # Stream mean |SHAP| chunk by chunk instead of materializing the full
+        # (n_rows, n_features) tensor; only the plotted sample rows are kept
+        sum_abs_shap = np.zeros(X.shape[1], dtype=np.float64)
+        n_outputs = 1
+        retained_values = []
+        plot_rows = np.empty(0, dtype=np.intp)
+        if generate_plot:
+            n_plot = min(ModelExplainability.SUMMARY_PLOT_MAX_ROWS, X.shape[0])
+            plot_rows = np.sort(
+                np.random.default_rng(0).choice(X.shape[0], n_plot, replace=False)
+            )
+        
+        for start in range(0, X.shape[0], chunk):
+            X_chunk = X[start:start + chunk]
+            if kind == 'permutation':
+                # Capped evaluation budget for the permutation explainer
+                chunk_values = explainer(X_chunk, max_evals=2 * X.shape[1] + 1).values
+            else:
+                chunk_values = explainer.shap_values(X_chunk)
+            chunk_values = ModelExplainability._as_row_feature_output(chunk_values)
+            n_outputs = chunk_values.shape[2]
+            
+            # Summed over rows and outputs; divided by both counts below
+            sum_abs_shap += np.abs(chunk_values, dtype=np.float32).sum(axis=(0, 2), dtype=np.float64)
+            if plot_rows.size:
+                in_chunk = plot_rows[(plot_rows >= start) & (plot_rows < start + len(X_chunk))]
+                retained_values.append(chunk_values[in_chunk - start])
+        
+        shap_summary_plot = None
+        if generate_plot:
+            import matplotlib.pyplot as plt
+            
+            # Single-output models plot an (n, f) array, classifiers a
+            # per-class list
+            plot_values = np.concatenate(retained_values)
+            plot_values = (
+                plot_values[:, :, 0] if plot_values.shape[2] == 1 
+                else list(np.moveaxis(plot_values, 2, 0))
+            )
+            shap.summary_plot(
+                plot_values, 
+                X[plot_rows], 
                 feature_names=feature_names, 
                 show=False
             )
+            shap_summary_plot = plt.gcf()
+        
+        return {
+            'mean_abs_shap': (sum_abs_shap / (X.shape[0] * n_outputs)).tolist(),
+            'feature_names': feature_names or [f'Feature_{i}' for i in range(X.shape[1])],
+            'shap_summary_plot': shap_summary_plot
         }
     
+    @staticmethod
+    def _as_row_feature_output(shap_values) -> np.ndarray:
+        """
+        Normalize SHAP values to a (rows, features, outputs) array.
+        
+        Regressors yield (n, f); classifiers yield either a list of per-class
+        (n, f) arrays or an (n, f, c) array depending on explainer and version.
+        
+        Args:
+            shap_values: SHAP values as returned by the explainer
+        
+        Returns:
+            np.ndarray: SHAP values of shape (n, f, c), with c = 1 for
+            single-output models
+        """
+        if isinstance(shap_values, list):
+            return np.stack(shap_values, axis=-1)
+        shap_values = np.asarray(shap_values)
+        return shap_values[:, :, np.newaxis] if shap_values.ndim == 2 else shap_values
+    
+    @classmethod
+    def _get_explainer(
+        cls, 
+        model, 
+        X: np.ndarray, 
+        device: str = 'auto', 
+        background: np.ndarray = None
+    ) -> Tuple[Any, str]:
+        """
+        Return a SHAP explainer for the model, reusing a cached one if possible.
+        
+        Tree explainers depend only on the model; permutation explainers are
+        additionally keyed on a fingerprint of their background data. Cached
+        entries hold a reference to the model, so its id cannot be reused
+        while cached, and to its fitted attributes, so a refit in place is
+        detected and the explainer rebuilt. The cache is kept small.
+        
+        Args:
+            model: Trained machine learning model
+            X (np.ndarray): Feature matrix
+            device (str, optional): SHAP device selection ('auto', 'cuda' or 'cpu')
+            background (np.ndarray, optional): Background rows for non-tree models
+        
+        Returns:
+            Tuple[Any, str]: Explainer and its kind ('gpu_tree', 'tree' or 'permutation')
+        """
+        is_tree = cls._is_tree_model(model)
+        
+        if is_tree:
+            key = (id(model), 'tree', device)
+        else:
+            fingerprint_rows = X[:256] if background is None else background
+            fingerprint = hashlib.blake2b(
+                np.ascontiguousarray(fingerprint_rows).tobytes(), digest_size=16
+            ).hexdigest()
+            key = (id(model), 'permutation', background is None, fingerprint)
+        
+        fitted_state = cls._fitted_state(model)
+        cached = cls._explainer_cache.get(key)
+        if cached is not None:
+            cached_model, cached_state, explainer, kind = cached
+            if cached_model is model and len(cached_state) == len(fitted_state) and all(
+                a is b for a, b in zip(cached_state, fitted_state)
+            ):
+                cls._explainer_cache.move_to_end(key)
+                return explainer, kind
+        
+        if is_tree:
+            explainer = None
+            kind = 'gpu_tree'
+            
+            # GPUTreeShap when CUDA is present; shap builds without CUDA raise
+            if device != 'cpu' and cls._cuda_available():
+                try:
+                    explainer = shap.explainers.GPUTree(model)
+                except (ImportError, RuntimeError):
+                    explainer = None
+            
+            if explainer is None:
+                kind = 'tree'
+                # Exact TreeSHAP; FastTreeSHAP is a faster drop-in when installed
+                try:
+                    import fasttreeshap
+                    explainer = fasttreeshap.TreeExplainer(model, algorithm='v2', n_jobs=-1)
+                except ImportError:
+                    explainer = shap.TreeExplainer(model)
+        else:
+            kind = 'permutation'
+            if background is None:
+                background = shap.sample(X, 100)
+            explainer = shap.Explainer(
+                model.predict, 
+                shap.maskers.Independent(background), 
+                algorithm='permutation'
+            )
+        
+        cls._explainer_cache[key] = (model, fitted_state, explainer, kind)
+        cls._explainer_cache.move_to_end(key)
+        while len(cls._explainer_cache) > cls.EXPLAINER_CACHE_SIZE:
+            cls._explainer_cache.popitem(last=False)
+        
+        return explainer, kind
+    
+    @staticmethod
+    def _fitted_state(model) -> Tuple:
+        """
+        Objects that fitting (re)creates on the model.
+        
+        Covers sklearn-style trailing-underscore attributes (``estimators_``,
+        ``tree_``) and the ``_Booster`` of XGBoost and LightGBM wrappers.
+        
+        Args:
+            model: Trained machine learning model
+        
+        Returns:
+            Tuple: Fitted attribute values, in attribute name order
+        """
+        attributes = getattr(model, '__dict__', {})
+        return tuple(
+            attributes[name] for name in sorted(attributes)
+            if name == '_Booster' or (name.endswith('_') and not name.startswith('__'))
+        )
+    
+    @staticmethod
+    def _cuda_available() -> bool:
+        """
+        Probe for a usable CUDA device via CuPy or PyTorch.
+        
+        Returns:
+            bool: True if at least one CUDA device is visible
+        """
+        try:
+            import cupy
+            return cupy.cuda.runtime.getDeviceCount() > 0
+        except Exception:
+            pass
+        
+        try:
+            import torch
+            return torch.cuda.is_available()
+        except ImportError:
+            return False
+    
+    @staticmethod
+    def _is_tree_model(model) -> bool:
+        """
+        Check whether a model is a tree ensemble supported by TreeSHAP.
+        
+        Args:
+            model: Trained machine learning model
+        
+        Returns:
+            bool: True for XGBoost, LightGBM, CatBoost and sklearn tree ensembles
+        """
+        from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
+        from sklearn.ensemble._forest import BaseForest
+        from sklearn.ensemble._gb import BaseGradientBoosting
+        from sklearn.tree import BaseDecisionTree
+        
+        tree_types = [
+            BaseDecisionTree,
+            BaseForest,
+            BaseGradientBoosting,
+            HistGradientBoostingClassifier,
+            HistGradientBoostingRegressor
+        ]
+        
+        try:
+            import xgboost
+            tree_types += [xgboost.Booster, xgboost.XGBModel]
+        except ImportError:
+            pass
+        
+        try:
+            import lightgbm
+            tree_types += [lightgbm.Booster, lightgbm.LGBMModel]
+        except ImportError:
+            pass
+        
+        try:
+            import catboost
+            tree_types.append(catboost.CatBoost)
+        except ImportError:
+            pass
+        
+        return isinstance(model, tuple(tree_types))
+    
     @staticmethod
     def permutation_feature_importance(
         model, 
         X: np.ndarray, 
         y: np.ndarray, 
-        feature_names: List[str] = None
+        feature_names: List[str] = None,
+        n_jobs: int = -1,
+        scoring: str = None
     ) -> Dict[str, Any]:
         """
         Calculate permutation feature importance.
         
+        Each scoring pass uses at most ``PERMUTATION_MAX_SAMPLES`` rows.
+        
         Args:
             model: Trained machine learning model
             X (np.ndarray): Feature matrix
             y (np.ndarray): Target values
             feature_names (List[str], optional): Names of features
+            n_jobs (int, optional): Parallel jobs across features (-1 uses all cores)
+            scoring (str, optional): Scorer name; defaults to the model's own score method
         
         Returns:
             Dict[str, Any]: Permutation feature importance
@@ -71,8 +339,11 @@ class ModelExplainability:
             model, 
             X, 
             y, 
+            scoring=scoring,
             n_repeats=10, 
-            random_state=42
+            n_jobs=n_jobs,
+            random_state=42,
+            max_samples=min(ModelExplainability.PERMUTATION_MAX_SAMPLES, X.shape[0])
         )
         
         return {
@@ -88,7 +359,8 @@ class ModelExplainability:
         X: np.ndarray, 
         y: np.ndarray,
         feature_names: List[str] = None,
-        report_path: str = None
+        report_path: str = None,
+        device: str = 'auto'
     ) -> Dict[str, Any]:
         """
         Generate comprehensive model explanation report.
@@ -99,13 +371,14 @@ class ModelExplainability:
             y (np.ndarray): Target values
             feature_names (List[str], optional): Names of features
             report_path (str, optional): Path to save the report
+            device (str, optional): SHAP device selection ('auto', 'cuda' or 'cpu')
         
         Returns:
             Dict[str, Any]: Comprehensive model explanation report
         """
         report = {
             'shap_importance': cls.shap_feature_importance(
-                model, X, feature_names
+                model, X, feature_names, device=device
             ),
             'permutation_importance': cls.permutation_feature_importance(
                 model, X, y, feature_names
@@ -126,15 +399,24 @@ class ModelExplainability:
             report (Dict[str, Any]): Model explanation report dictionary
             path (str): File path to save the report
         """
-        with open(path, 'w') as f:
-            import json
-            json.dump(report, f, indent=4)
+        if orjson is not None:
+            # Native NumPy support, so array payloads need no list conversion
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(path, 'w') as f:
+                import json
+                json.dump(report, f, indent=4, default=lambda obj: obj.tolist())
     
     @staticmethod
     def generate_feature_importance_plot(
         importances: List[float], 
         feature_names: List[str], 
-        title: str = 'Feature Importance'
+        title: str = 'Feature Importance',
+        top_k: int = None
     ) -> go.Figure:
         """
         Generate an interactive feature importance plot.
@@ -143,14 +425,23 @@ class ModelExplainability:
             importances (List[float]): Feature importance scores
             feature_names (List[str]): Names of features
             title (str, optional): Plot title
+            top_k (int, optional): Only plot the k most important features
         
         Returns:
             go.Figure: Interactive feature importance plot
         """
+        importances = np.asarray(importances, dtype=np.float32)
+        
+        # Select the top-k candidates in linear time before sorting them
+        if top_k is not None and top_k < importances.size:
+            candidate_indices = np.argpartition(importances, -top_k)[-top_k:]
+        else:
+            candidate_indices = np.arange(importances.size)
+        
         # Sort features by importance in descending order
-        sorted_indices = np.argsort(importances)[::-1]
-        sorted_importances = [importances[i] for i in sorted_indices]
-        sorted_features = [feature_names[i] for i in sorted_indices]
+        sorted_indices = candidate_indices[np.argsort(importances[candidate_indices])[::-1]]
+        sorted_importances = importances[sorted_indices]
+        sorted_features = np.asarray(feature_names, dtype=object)[sorted_indices].tolist()
         
         fig = go.Figure(
             data=[go.Bar(
@@ -193,22 +484,38 @@ class ModelExplainability:
         Returns:
             go.Figure: Partial dependence plot
         """
-        from sklearn.inspection import partial_dependence
+        from sklearn.base import is_classifier
         
-        # Create a copy of X to avoid modifying the original
-        X_copy = X.copy()
+        grid_resolution = 100
+        X = np.asarray(X)
+        n_rows, n_features = X.shape
         
-        # Generate partial dependence
-        pd_results = partial_dependence(
-            model, 
-            X_copy, 
-            features=[feature_index], 
-            grid_resolution=100
-        )
+        # Same grid as sklearn: unique values for low-cardinality features,
+        # otherwise evenly spaced values between the 5th and 95th percentiles
+        column = X[:, feature_index]
+        feature_values = np.unique(column)
+        if feature_values.size >= grid_resolution:
+            feature_values = np.linspace(*np.percentile(column, [5, 95]), grid_resolution)
+        
+        if is_classifier(model):
+            predict = lambda data: model.predict_proba(data)[:, 1]
+        else:
+            predict = model.predict
         
-        # Extract values
-        feature_values = pd_results['values'][0]
-        pd_values = pd_results['average'][0]
+        # Brute-force partial dependence: tile X once per batch of grid points,
+        # overwrite the feature column and score the whole batch in one call
+        pd_values = np.empty(feature_values.size, dtype=np.float64)
+        points_per_batch = max(1, ModelExplainability.PDP_MAX_BATCH_ROWS // n_rows)
+        
+        for start in range(0, feature_values.size, points_per_batch):
+            grid_batch = feature_values[start:start + points_per_batch]
+            X_tiled = np.broadcast_to(X, (grid_batch.size, n_rows, n_features)).copy()
+            X_tiled[:, :, feature_index] = grid_batch[:, None]
+            
+            predictions = np.asarray(predict(X_tiled.reshape(-1, n_features)))
+            pd_values[start:start + grid_batch.size] = (
+                predictions.reshape(grid_batch.size, n_rows).mean(axis=1)
+            )
         
         # Create plot
         fig = go.Figure(
@@ -4,19 +4,73 @@ from typing import Dict, List, Any
 from sklearn.metrics import (
     mean_squared_error, 
     mean_absolute_error, 
-    r2_score, 
     precision_score, 
     recall_score, 
     f1_score,
     confusion_matrix
 )
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _regression_stats_numpy(y_true: np.ndarray, y_pred: np.ndarray, mean_y: float):
+    """
+    NumPy fallback for the fused regression statistics kernel.
+    """
+    y_true = y_true.astype(np.float64)
+    diff = y_true - y_pred
+    centred = y_true - mean_y
+    return float(diff @ diff), float(np.abs(diff).sum()), float(centred @ centred)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _regression_stats(y_true, y_pred, mean_y):
+        """
+        Single parallel pass returning (sum sq. error, sum abs. error, total
+        sum of squares about ``mean_y``).
+        """
+        sse = 0.0
+        sae = 0.0
+        sst = 0.0
+        for i in prange(y_true.size):
+            y = np.float64(y_true[i])
+            diff = y - y_pred[i]
+            sse += diff * diff
+            sae += abs(diff)
+            centred = y - mean_y
+            sst += centred * centred
+        return sse, sae, sst
+else:
+    _regression_stats = _regression_stats_numpy
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class PerformanceMetrics:
     """
     Comprehensive performance metrics calculation for machine learning models
     in the Sports Prop Predictor project.
     """
     
+    @staticmethod
+    def _prep(y: np.ndarray) -> np.ndarray:
+        """
+        Flatten targets into a contiguous float32 array, validated once per call.
+        
+        Args:
+            y (np.ndarray): Target values (array-like)
+        
+        Returns:
+            np.ndarray: Contiguous 1-D float32 array
+        """
+        return np.ascontiguousarray(np.asarray(y).ravel(), dtype=np.float32)
+    
     @staticmethod
     def regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
         """
@@ -29,11 +83,28 @@ class PerformanceMetrics:
         Returns:
             Dict[str, float]: Dictionary of performance metrics
         """
+        y_true = PerformanceMetrics._prep(y_true)
+        y_pred = PerformanceMetrics._prep(y_pred)
+        n = y_true.size
+        
+        # The mean is taken first so the total sum of squares is summed from
+        # centred values, avoiding the cancellation of sum(y^2) - n*mean^2;
+        # everything else comes from the same fused pass
+        mean_y = float(y_true.mean(dtype=np.float64))
+        sse, sae, total_sum_squares = _regression_stats(y_true, y_pred, mean_y)
+        mse = sse / n
+        
+        # Same convention as sklearn's r2_score for a constant target
+        if total_sum_squares > 0:
+            r2 = 1.0 - sse / total_sum_squares
+        else:
+            r2 = 1.0 if sse == 0 else 0.0
+        
         return {
-            'mean_squared_error': mean_squared_error(y_true, y_pred),
-            'root_mean_squared_error': np.sqrt(mean_squared_error(y_true, y_pred)),
-            'mean_absolute_error': mean_absolute_error(y_true, y_pred),
-            'r2_score': r2_score(y_true, y_pred)
+            'mean_squared_error': mse,
+            'root_mean_squared_error': np.sqrt(mse),
+            'mean_absolute_error': sae / n,
+            'r2_score': r2
         }
     
     @staticmethod
@@ -49,11 +120,16 @@ class PerformanceMetrics:
         Returns:
             Dict[str, float]: Dictionary of performance metrics
         """
+        # Labels keep their dtype: strings must survive, and large integer
+        # class IDs would collide in float32
+        y_true = np.asarray(y_true).ravel()
+        y_pred = np.asarray(y_pred).ravel()
+        
         return {
             'precision': precision_score(y_true, y_pred, average=avg),
             'recall': recall_score(y_true, y_pred, average=avg),
             'f1_score': f1_score(y_true, y_pred, average=avg),
-            'confusion_matrix': confusion_matrix(y_true, y_pred).tolist()
+            'confusion_matrix': confusion_matrix(y_true, y_pred)
         }
     
     @staticmethod
@@ -73,6 +149,9 @@ class PerformanceMetrics:
         Returns:
             Dict[str, float]: Dictionary of time series performance metrics
         """
+        y_true = PerformanceMetrics._prep(y_true)
+        y_pred = PerformanceMetrics._prep(y_pred)
+        
         # Shift series to account for prediction horizon
         y_true_shifted = y_true[prediction_horizon:]
         y_pred_shifted = y_pred[:-prediction_horizon]
@@ -124,6 +203,14 @@ class PerformanceMetrics:
             report (Dict[str, Any]): Performance report dictionary
             path (str): File path to save the report
         """
-        with open(path, 'w') as f:
-            import json
-            json.dump(report, f, indent=4)
\ No newline at end of file
+        if orjson is not None:
+            # Native NumPy support, so array payloads need no list conversion
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(path, 'w') as f:
+                import json
+                json.dump(report, f, indent=4, default=lambda obj: obj.tolist())
\ No newline at end of file
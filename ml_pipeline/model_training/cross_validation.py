@@ -2,12 +2,12 @@ import logging
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, Tuple, List
+from joblib import Parallel, delayed
+from sklearn.base import clone
 from sklearn.model_selection import (
     KFold, 
     StratifiedKFold, 
-    TimeSeriesSplit, 
-    cross_val_score, 
-    cross_validate
+    TimeSeriesSplit
 )
 from sklearn.metrics import (
     mean_squared_error, 
@@ -16,12 +16,75 @@ from sklearn.metrics import (
     mean_absolute_percentage_error
 )
 
+
+def _fit_fold(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray
+) -> Tuple[float, float]:
+    """
+    Fit a fresh copy of a model on one fold and score it
+    
+    Args:
+        model (Any): Unfitted estimator template
+        X (np.ndarray): Feature matrix
+        y (np.ndarray): Target vector
+        train_idx (np.ndarray): Training indices of the fold
+        test_idx (np.ndarray): Test indices of the fold
+    
+    Returns:
+        Tuple of (train score, test score)
+    """
+    X_train, X_test = X[train_idx], X[test_idx]
+    y_train, y_test = y[train_idx], y[test_idx]
+    
+    fold_model = clone(model)
+    fold_model.fit(X_train, y_train)
+    
+    return fold_model.score(X_train, y_train), fold_model.score(X_test, y_test)
+
+
+def _fold_predictions(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fit a fresh copy of a model on one fold and predict both partitions
+    
+    Args:
+        model (Any): Unfitted estimator template
+        X (np.ndarray): Feature matrix
+        y (np.ndarray): Target vector
+        train_idx (np.ndarray): Training indices of the fold
+        test_idx (np.ndarray): Test indices of the fold
+    
+    Returns:
+        Tuple of (train predictions, test predictions)
+    """
+    fold_model = clone(model)
+    fold_model.fit(X[train_idx], y[train_idx])
+    
+    return fold_model.predict(X[train_idx]), fold_model.predict(X[test_idx])
+
+
 class CrossValidator:
     """
     Advanced cross-validation module for sports prediction models
     Supports multiple cross-validation strategies and detailed performance tracking
     """
     
+    # Constructor parameters accepted by each CV strategy
+    PARAM_ALLOW = {
+        'kfold': {'n_splits', 'shuffle', 'random_state'},
+        'stratified_kfold': {'n_splits', 'shuffle', 'random_state'},
+        'time_series': {'n_splits', 'max_train_size', 'test_size', 'gap'}
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize cross-validator with configuration
@@ -72,7 +135,15 @@ class CrossValidator:
             }
             default_params.update(kwargs)
             
-            return cv_class(**default_params)
+            # Drop parameters the strategy does not accept (TimeSeriesSplit
+            # neither shuffles nor takes a random_state)
+            allowed = self.PARAM_ALLOW[strategy.lower()]
+            cv_params = {
+                key: value for key, value in default_params.items() 
+                if key in allowed
+            }
+            
+            return cv_class(**cv_params)
         
         except Exception as e:
             self.logger.error(f"Error selecting CV strategy: {e}")
@@ -95,25 +166,57 @@ class CrossValidator:
                 self.config.get('cv_strategy', 'kfold')
             )
             
-            # Detailed cross-validation
-            cv_results = cross_validate(
-                estimator=self.config.get('model'),
-                X=X,
-                y=y,
-                cv=cv_strategy,
-                scoring=list(self.metrics.keys()),
-                return_train_score=True
+            # One fit per fold; every metric is computed from the cached
+            # fold predictions rather than through sklearn scorers
+            folds = list(cv_strategy.split(X, y))
+            model = self.config.get('model')
+            fold_predictions = Parallel(n_jobs=-1)(
+                delayed(_fold_predictions)(model, X, y, train_idx, test_idx)
+                for train_idx, test_idx in folds
             )
             
-            # Compute detailed performance summary
+            metric_names = list(self.metrics.keys())
+            cv_results = {}
+            for metric in metric_names:
+                metric_fn = self.metrics[metric]
+                cv_results[f'test_{metric}'] = np.array([
+                    metric_fn(y[test_idx], test_pred)
+                    for (_, test_idx), (_, test_pred) in zip(folds, fold_predictions)
+                ])
+                cv_results[f'train_{metric}'] = np.array([
+                    metric_fn(y[train_idx], train_pred)
+                    for (train_idx, _), (train_pred, _) in zip(folds, fold_predictions)
+                ])
+            
+            # Pooled out-of-fold metrics, as cross_val_predict would give
+            oof_idx = np.concatenate([test_idx for _, test_idx in folds])
+            oof_pred = np.concatenate([test_pred for _, test_pred in fold_predictions])
+            out_of_fold_metrics = {
+                metric: self.metrics[metric](y[oof_idx], oof_pred) 
+                for metric in metric_names
+            }
+            
+            # Compute detailed performance summary from (n_metrics, n_splits)
+            # score matrices so each statistic is a single vectorised call;
+            # float64 keeps full precision and json-serializable values
+            test_scores = np.array(
+                [cv_results[f'test_{metric}'] for metric in metric_names], dtype=np.float64
+            )
+            train_scores = np.array(
+                [cv_results[f'train_{metric}'] for metric in metric_names], dtype=np.float64
+            )
+            
+            test_mean, test_std = test_scores.mean(axis=1), test_scores.std(axis=1)
+            train_mean, train_std = train_scores.mean(axis=1), train_scores.std(axis=1)
+            
             performance_summary = {
                 metric: {
-                    'test_mean': np.mean(cv_results[f'test_{metric}']),
-                    'test_std': np.std(cv_results[f'test_{metric}']),
-                    'train_mean': np.mean(cv_results[f'train_{metric}']),
-                    'train_std': np.std(cv_results[f'train_{metric}'])
+                    'test_mean': test_mean[i],
+                    'test_std': test_std[i],
+                    'train_mean': train_mean[i],
+                    'train_std': train_std[i]
                 }
-                for metric in self.metrics.keys()
+                for i, metric in enumerate(metric_names)
             }
             
             # Log performance
@@ -124,6 +227,7 @@ class CrossValidator:
             return {
                 'cv_strategy': str(cv_strategy),
                 'performance_summary': performance_summary,
+                'out_of_fold_metrics': out_of_fold_metrics,
                 'raw_results': cv_results
             }
         
@@ -143,18 +247,16 @@ class CrossValidator:
             Dict of variance metrics
         """
         try:
-            train_scores, test_scores = [], []
+            cv_strategy = self._select_cv_strategy()
+            folds = list(cv_strategy.split(X))
+            model = self.config.get('model')
             
-            # Iterative variance analysis
-            for train_idx, test_idx in self._select_cv_strategy().split(X):
-                X_train, X_test = X[train_idx], X[test_idx]
-                y_train, y_test = y[train_idx], y[test_idx]
-                
-                model = self.config.get('model')
-                model.fit(X_train, y_train)
-                
-                train_scores.append(model.score(X_train, y_train))
-                test_scores.append(model.score(X_test, y_test))
+            # Each fold fits its own clone of the model in a worker process
+            fold_scores = Parallel(n_jobs=-1, prefer='processes')(
+                delayed(_fit_fold)(model, X, y, train_idx, test_idx)
+                for train_idx, test_idx in folds
+            )
+            train_scores, test_scores = map(list, zip(*fold_scores))
             
             variance_report = {
                 'train_variance': np.var(train_scores),
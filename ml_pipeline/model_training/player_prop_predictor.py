@@ -1,19 +1,57 @@
+import hashlib
 import logging
+import os
+import threading
 import numpy as np
 import pandas as pd
 import xgboost as xgb
 import joblib
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.impute import SimpleImputer
 
+# Mock feature distributions (to be replaced with actual API integrations):
+# Gaussian columns as (column index, mean, std), drawn in one call
+_MOCK_NORMAL_COLUMNS = np.array([0, 1, 2, 3, 6, 7])
+_MOCK_NORMAL_LOC = np.array([20.0, 0.5, 100.0, 18.0, 0.0, 0.0])
+_MOCK_NORMAL_SCALE = np.array([5.0, 0.1, 20.0, 3.0, 0.2, 0.3])
+_MOCK_REST_DAYS_COLUMN = 4
+_MOCK_INJURY_RISK_COLUMN = 5
+
 class PlayerPropPredictionModel:
     """
     Advanced Machine Learning Model for Player Prop Predictions
     Integrates multiple data sources and ML techniques
     """
     
+    # Rows per tile when large prediction batches are split across threads
+    PREDICT_CHUNK_ROWS = 1024
+    
+    # Concurrent per-player requests when collecting external data
+    EXTERNAL_DATA_WORKERS = 32
+    
+    # Smallest batch routed to GPU inference when config['use_gpu'] is set
+    GPU_MIN_ROWS = 10_000
+    
+    # Default model inputs, in the column order the booster is trained on
+    DEFAULT_FEATURE_COLUMNS = (
+        'player_recent_performance',
+        'team_performance',
+        'opponent_defense_rating',
+        'historical_averages',
+        'rest_days',
+        'injury_risk_score',
+        'home_away_performance',
+        'matchup_historical_stats'
+    )
+    
+    # Loaded models per (sport, prediction type, feature set), shared by
+    # every caller in the process
+    _MODEL_CACHE: Dict[Tuple[str, str, Tuple[str, ...]], 'PlayerPropPredictionModel'] = {}
+    _MODEL_CACHE_LOCK = threading.Lock()
+    
     def __init__(self, 
                  sport: str = 'basketball', 
                  prediction_type: str = 'points',
@@ -35,32 +73,42 @@ class PlayerPropPredictionModel:
         self.sport = sport
         self.prediction_type = prediction_type
         
-        # Model components
+        # Random source for the mock data feeds
+        self._rng = np.random.default_rng(self.config.get('random_seed'))
+        
+        # Per-player external data source returning {feature: value};
+        # the mock feeds are used while this is unset
+        self.player_data_fetcher: Optional[Callable[[str], Dict[str, float]]] = None
+        
+        # Model components; the booster is kept for DMatrix-free inference
         self.model = None
+        self._booster = None
+        
+        # Optional natively compiled copy of the ensemble (see compile_model)
+        # and GPU Forest Inference copy (see predict_batch_gpu)
+        self._compiled_predictor = None
+        self._fil_model = None
         self.scaler = StandardScaler()
         self.imputer = SimpleImputer(strategy='median')
         
+        # Fitted imputer medians and scaler folded into a float32 affine map
+        # (x * scale + offset), applied without going through sklearn
+        self._medians = None
+        self._scale_inv = None
+        self._scaled_offset = None
+        
         # Feature engineering parameters
-        self.feature_columns = [
-            'player_recent_performance',
-            'team_performance',
-            'opponent_defense_rating',
-            'historical_averages',
-            'rest_days',
-            'injury_risk_score',
-            'home_away_performance',
-            'matchup_historical_stats'
-        ]
+        self.feature_columns = list(self.DEFAULT_FEATURE_COLUMNS)
     
-    def _collect_external_data(self, player_name: str) -> pd.DataFrame:
+    def _collect_external_data(self, player_names: List[str]) -> pd.DataFrame:
         """
         Collect external data from various sources
         
         Args:
-            player_name (str): Name of the player
+            player_names (List[str]): Names of the players
         
         Returns:
-            DataFrame with collected player data
+            DataFrame with one row of collected data per player
         """
         try:
             # Placeholder for multiple data source integration
@@ -69,40 +117,104 @@ class PlayerPropPredictionModel:
             # 2. Historical performance databases
             # 3. Real-time statistics
             
-            # Mock data generation for demonstration
-            data = {
-                'player_recent_performance': self._get_recent_performance(player_name),
-                'team_performance': self._get_team_performance(player_name),
-                'opponent_defense_rating': self._get_opponent_defense(player_name),
-                'historical_averages': self._get_historical_averages(player_name),
-                'rest_days': self._calculate_rest_days(player_name),
-                'injury_risk_score': self._calculate_injury_risk(player_name),
-                'home_away_performance': self._get_home_away_performance(player_name),
-                'matchup_historical_stats': self._get_matchup_stats(player_name)
-            }
+            if self.player_data_fetcher is not None:
+                # Per-player fetches are I/O-bound, so run them concurrently
+                max_workers = max(1, min(self.EXTERNAL_DATA_WORKERS, len(player_names)))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    records = list(executor.map(
+                        self._collect_external_data_one, player_names
+                    ))
+                return pd.DataFrame.from_records(records, columns=self.feature_columns)
             
-            return pd.DataFrame([data])
+            # Mock data generation for demonstration: one draw per
+            # distribution for the whole batch, columns in feature order
+            n_players = len(player_names)
+            data = np.empty((n_players, len(self.feature_columns)))
+            data[:, _MOCK_NORMAL_COLUMNS] = self._rng.normal(
+                _MOCK_NORMAL_LOC, _MOCK_NORMAL_SCALE, 
+                size=(n_players, len(_MOCK_NORMAL_COLUMNS))
+            )
+            data[:, _MOCK_REST_DAYS_COLUMN] = self._rng.integers(0, 5, size=n_players)
+            data[:, _MOCK_INJURY_RISK_COLUMN] = self._rng.uniform(0, 1, size=n_players)
+            
+            return pd.DataFrame(data, columns=self.feature_columns)
         
         except Exception as e:
             self.logger.error(f"External data collection failed: {e}")
             raise
     
+    def _collect_external_data_one(self, player_name: str) -> Dict[str, float]:
+        """
+        Collect external data for a single player from the configured source
+        
+        Args:
+            player_name (str): Name of the player
+        
+        Returns:
+            Mapping of feature name to value
+        """
+        return self.player_data_fetcher(player_name)
+    
+    def _fit_preprocess(self, features: np.ndarray) -> None:
+        """
+        Fit the imputer and scaler on training data
+        
+        Args:
+            features (np.ndarray): Training feature matrix, in feature_columns order
+        """
+        try:
+            # Fit missing value statistics, then scaling on imputed values
+            self.imputer.fit(features)
+            self.scaler.fit(self.imputer.transform(features))
+            self._cache_preprocess_state()
+        
+        except Exception as e:
+            self.logger.error(f"Preprocessing fit failed: {e}")
+            raise
+    
+    def _cache_preprocess_state(self) -> None:
+        """
+        Precompute the fitted imputer medians and scaler as float32 vectors
+        """
+        self._medians = self.imputer.statistics_.astype(np.float32)
+        self._scale_inv = (1.0 / self.scaler.scale_).astype(np.float32)
+        self._scaled_offset = (-self.scaler.mean_ / self.scaler.scale_).astype(np.float32)
+    
     def _preprocess_data(self, data: pd.DataFrame) -> np.ndarray:
         """
         Preprocess and prepare data for model training/prediction
         
+        Applies the imputer and scaler fitted by ``_fit_preprocess``;
+        nothing is refitted here.
+        
         Args:
             data (pd.DataFrame): Input data
         
         Returns:
-            Preprocessed numpy array
+            Preprocessed C-contiguous float32 array
+        """
+        return self._transform_features(data[self.feature_columns].values)
+    
+    def _transform_features(self, features: np.ndarray) -> np.ndarray:
+        """
+        Impute and scale a feature matrix with the fitted preprocessing state
+        
+        Args:
+            features (np.ndarray): Feature matrix, in feature_columns order
+        
+        Returns:
+            Preprocessed C-contiguous float32 array
         """
         try:
-            # Handle missing values
-            data_imputed = self.imputer.fit_transform(data[self.feature_columns])
+            # Private float32 copy in XGBoost's native layout, modified in place
+            data_scaled = np.array(features, dtype=np.float32, order='C')
             
-            # Scale features
-            data_scaled = self.scaler.fit_transform(data_imputed)
+            # Handle missing values with the medians learned in training
+            np.copyto(data_scaled, self._medians, where=np.isnan(data_scaled))
+            
+            # Scale features in place as (x - mean) / std == x * scale + offset
+            np.multiply(data_scaled, self._scale_inv, out=data_scaled)
+            np.add(data_scaled, self._scaled_offset, out=data_scaled)
             
             return data_scaled
         
@@ -110,23 +222,37 @@ class PlayerPropPredictionModel:
             self.logger.error(f"Data preprocessing failed: {e}")
             raise
     
-    def train(self, player_data: List[Dict[str, Any]]):
+    def train(self, player_data: Union[pd.DataFrame, np.ndarray, List[Dict[str, Any]]]):
         """
         Train the prediction model
         
         Args:
-            player_data (List[Dict[str, Any]]): Training data for multiple players
+            player_data (Union[pd.DataFrame, np.ndarray, List[Dict[str, Any]]]):
+                Training data for multiple players. Arrays are either
+                structured or 2-D with columns in feature_columns order
+                followed by 'actual_prop_value'.
         """
         try:
             # Prepare training dataset
-            training_df = pd.DataFrame(player_data)
+            columns = self.feature_columns + ['actual_prop_value']
+            if isinstance(player_data, pd.DataFrame):
+                training_df = player_data
+            elif isinstance(player_data, np.ndarray):
+                training_df = pd.DataFrame(
+                    player_data, 
+                    columns=None if player_data.dtype.names else columns,
+                    copy=False
+                )
+            else:
+                training_df = pd.DataFrame.from_records(player_data, columns=columns)
             
             # Split features and target
-            X = training_df[self.feature_columns]
-            y = training_df['actual_prop_value']
+            X = training_df[self.feature_columns].to_numpy(dtype=np.float32, copy=False)
+            y = training_df['actual_prop_value'].to_numpy()
             
-            # Preprocess data
-            X_processed = self._preprocess_data(X)
+            # Fit preprocessing once, then transform
+            self._fit_preprocess(X)
+            X_processed = self._transform_features(X)
             
             # Train-test split
             X_train, X_test, y_train, y_test = train_test_split(
@@ -141,16 +267,23 @@ class PlayerPropPredictionModel:
                 min_child_weight=1,
                 subsample=0.8,
                 colsample_bytree=0.8,
+                tree_method='hist',
+                max_bin=256,
+                early_stopping_rounds=10,
+                n_jobs=os.cpu_count(),
                 random_state=42
             )
             
-            # Train model
+            # Train model; with hist the wrapper quantises the training data
+            # into a QuantileDMatrix and bins the eval set against it
             self.model.fit(
                 X_train, y_train,
                 eval_set=[(X_test, y_test)],
-                early_stopping_rounds=10,
                 verbose=False
             )
+            self._booster = self.model.get_booster()
+            self._compiled_predictor = None
+            self._fil_model = None
             
             # Evaluate and log performance
             train_score = self.model.score(X_train, y_train)
@@ -174,113 +307,354 @@ class PlayerPropPredictionModel:
         Returns:
             Prediction results and confidence
         """
+        return self.predict_batch([player_name])[0]
+    
+    def predict_batch(self, player_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Predict player prop performance for several players at once
+        
+        All players are scored in a single model call, so per-call overhead
+        is paid once for the whole batch.
+        
+        Args:
+            player_names (List[str]): Names of the players to predict
+        
+        Returns:
+            Prediction results and confidence, one entry per player
+        """
         try:
             # Collect external data
-            player_data = self._collect_external_data(player_name)
+            player_data = self._collect_external_data(player_names)
             
             # Preprocess data
             processed_data = self._preprocess_data(player_data)
             
-            # Make prediction
-            prediction = self.model.predict(processed_data)[0]
+            # Make predictions
+            predictions = self._predict_rows(processed_data)
             
             # Confidence calculation (placeholder)
-            prediction_confidence = self._calculate_prediction_confidence(
-                player_name, prediction
+            confidences = self._calculate_prediction_confidence(
+                player_names, predictions
             )
             
-            return {
-                'player': player_name,
-                'predicted_prop_value': prediction,
-                'confidence': prediction_confidence,
-                'prediction_type': self.prediction_type
-            }
+            return [
+                {
+                    'player': player_name,
+                    'predicted_prop_value': prediction,
+                    'confidence': confidence,
+                    'prediction_type': self.prediction_type
+                }
+                for player_name, prediction, confidence 
+                in zip(player_names, predictions, confidences)
+            ]
         
         except Exception as e:
-            self.logger.error(f"Prediction failed for {player_name}: {e}")
+            self.logger.error(f"Prediction failed for {player_names}: {e}")
             raise
     
-    def _calculate_prediction_confidence(self, player_name: str, prediction: float) -> float:
+    def _predict_rows(self, X: np.ndarray) -> np.ndarray:
         """
-        Calculate prediction confidence based on multiple factors
+        Run the booster over preprocessed rows
+        
+        Large batches are split into row tiles of about ``PREDICT_CHUNK_ROWS``
+        that are predicted concurrently; ``inplace_predict`` releases the GIL
+        and each tile stays cache-resident while the trees are walked.
         
         Args:
-            player_name (str): Player name
-            prediction (float): Predicted prop value
+            X (np.ndarray): Preprocessed float32 features
         
         Returns:
-            Confidence score
+            Predicted prop values
         """
-        # Placeholder confidence calculation
-        # Would integrate multiple confidence signals
-        return np.random.uniform(0.6, 0.95)
-    
-    # Mock methods for data collection (to be replaced with actual API integrations)
-    def _get_recent_performance(self, player_name: str) -> float:
-        return np.random.normal(20, 5)
-    
-    def _get_team_performance(self, player_name: str) -> float:
-        return np.random.normal(0.5, 0.1)
-    
-    def _get_opponent_defense(self, player_name: str) -> float:
-        return np.random.normal(100, 20)
-    
-    def _get_historical_averages(self, player_name: str) -> float:
-        return np.random.normal(18, 3)
+        if (self.config.get('use_gpu', False) 
+                and len(X) >= self.GPU_MIN_ROWS 
+                and self._gpu_available()):
+            return self.predict_batch_gpu(X)
+        
+        if self._compiled_predictor is not None:
+            import tl2cgen
+            
+            return self._compiled_predictor.predict(tl2cgen.DMatrix(X)).reshape(-1)
+        
+        booster = self._booster
+        
+        # Honour early stopping the way XGBRegressor.predict does
+        best_iteration = getattr(self.model, 'best_iteration', None)
+        iteration_range = (0, best_iteration + 1) if best_iteration is not None else (0, 0)
+        
+        n_chunks = max(1, len(X) // self.PREDICT_CHUNK_ROWS)
+        if n_chunks == 1:
+            return booster.inplace_predict(X, iteration_range=iteration_range)
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            chunk_predictions = executor.map(
+                lambda chunk: booster.inplace_predict(chunk, iteration_range=iteration_range),
+                np.array_split(X, n_chunks)
+            )
+            return np.concatenate(list(chunk_predictions))
     
-    def _calculate_rest_days(self, player_name: str) -> int:
-        return np.random.randint(0, 5)
+    @staticmethod
+    def _gpu_available() -> bool:
+        """
+        Check whether a CUDA device and the RAPIDS stack are usable
+        
+        Returns:
+            True if GPU inference can run
+        """
+        try:
+            import cupy
+            return cupy.cuda.runtime.getDeviceCount() > 0
+        except Exception:
+            return False
     
-    def _calculate_injury_risk(self, player_name: str) -> float:
-        return np.random.uniform(0, 1)
+    def predict_batch_gpu(self, X: np.ndarray) -> np.ndarray:
+        """
+        Run preprocessed rows through RAPIDS Forest Inference on the GPU
+        
+        Intended for very large batches (e.g. whole player pool x matchup
+        grids); the forest is uploaded to the device on first use.
+        
+        Args:
+            X (np.ndarray): Preprocessed float32 features
+        
+        Returns:
+            Predicted prop values
+        """
+        import cupy
+        
+        if self._fil_model is None:
+            import treelite
+            from cuml import ForestInference
+            
+            # Only the trees kept by early stopping are uploaded
+            booster = self._booster
+            best_iteration = getattr(self.model, 'best_iteration', None)
+            if best_iteration is not None:
+                booster = booster[:best_iteration + 1]
+            
+            self._fil_model = ForestInference.load_from_treelite_model(
+                treelite.frontend.from_xgboost(booster), 
+                output_class=False
+            )
+        
+        X_gpu = cupy.asarray(np.ascontiguousarray(X, dtype=np.float32))
+        return cupy.asnumpy(self._fil_model.predict(X_gpu)).reshape(-1)
     
-    def _get_home_away_performance(self, player_name: str) -> float:
-        return np.random.normal(0, 0.2)
+    def compile_model(self, libpath: str) -> bool:
+        """
+        Compile the trained ensemble to a native shared library with Treelite
+        
+        The compiled library replaces XGBoost's generic tree interpreter for
+        CPU inference. Requires the optional ``treelite`` and ``tl2cgen``
+        packages and a C toolchain.
+        
+        Args:
+            libpath (str): Path of the shared library to write
+        
+        Returns:
+            True if the compiled predictor is now in use
+        """
+        try:
+            import treelite
+            import tl2cgen
+        except ImportError:
+            self.logger.warning("Treelite not available; keeping XGBoost inference")
+            return False
+        
+        try:
+            # Only the trees kept by early stopping are compiled
+            booster = self._booster
+            best_iteration = getattr(self.model, 'best_iteration', None)
+            if best_iteration is not None:
+                booster = booster[:best_iteration + 1]
+            
+            tl_model = treelite.frontend.from_xgboost(booster)
+            tl2cgen.export_lib(
+                tl_model, 
+                toolchain='gcc', 
+                libpath=libpath, 
+                params={'parallel_comp': os.cpu_count()}
+            )
+            self._compiled_predictor = tl2cgen.Predictor(libpath, nthread=os.cpu_count())
+            
+            self.logger.info(f"Model compiled to {libpath}")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"Model compilation failed: {e}")
+            return False
     
-    def _get_matchup_stats(self, player_name: str) -> float:
-        return np.random.normal(0, 0.3)
+    def _calculate_prediction_confidence(
+        self, 
+        player_names: List[str], 
+        predictions: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate prediction confidence based on multiple factors
+        
+        Args:
+            player_names (List[str]): Player names
+            predictions (np.ndarray): Predicted prop values
+        
+        Returns:
+            Confidence score per player
+        """
+        # Placeholder confidence calculation, one draw for the whole batch
+        # Would integrate multiple confidence signals
+        return self._rng.uniform(0.6, 0.95, size=len(player_names))
     
-    def save_model(self, filepath: str = 'player_prop_model.joblib'):
+    def save_model(self, filepath: str = 'player_prop_model'):
         """
         Save trained model to disk
         
+        The booster is written in XGBoost's native UBJSON format to
+        ``{filepath}.ubj``; the preprocessing state is pickled separately
+        to ``{filepath}.meta``. With ``config['compile_treelite']`` set, a
+        compiled ``{filepath}.so`` is written alongside.
+        
         Args:
-            filepath (str): Path to save the model
+            filepath (str): Path prefix to save the model
         """
         try:
+            self.model.save_model(f"{filepath}.ubj")
             joblib.dump({
-                'model': self.model,
                 'scaler': self.scaler,
                 'imputer': self.imputer,
                 'feature_columns': self.feature_columns,
-                'config': self.config
-            }, filepath)
+                'config': self.config,
+                'sport': self.sport,
+                'prediction_type': self.prediction_type
+            }, f"{filepath}.meta")
+            
+            if self.config.get('compile_treelite', False):
+                self.compile_model(f"{filepath}.so")
+            
             self.logger.info(f"Model saved to {filepath}")
         except Exception as e:
             self.logger.error(f"Model saving failed: {e}")
             raise
     
     @classmethod
-    def load_model(cls, filepath: str = 'player_prop_model.joblib'):
+    def load_model(cls, filepath: str = 'player_prop_model'):
         """
         Load pre-trained model from disk
         
         Args:
-            filepath (str): Path to load the model
+            filepath (str): Path prefix the model was saved under
         
         Returns:
             Loaded PlayerPropPredictionModel
         """
         try:
-            loaded_data = joblib.load(filepath)
-            model_instance = cls()
-            model_instance.model = loaded_data['model']
+            loaded_data = joblib.load(f"{filepath}.meta")
+            # The saved config goes through __init__ so everything derived
+            # from it (e.g. the seeded random source) is restored too
+            model_instance = cls(
+                sport=loaded_data.get('sport', 'basketball'),
+                prediction_type=loaded_data.get('prediction_type', 'points'),
+                config=loaded_data['config']
+            )
+            model_instance.model = xgb.XGBRegressor()
+            model_instance.model.load_model(f"{filepath}.ubj")
+            model_instance._booster = model_instance.model.get_booster()
             model_instance.scaler = loaded_data['scaler']
             model_instance.imputer = loaded_data['imputer']
+            model_instance._cache_preprocess_state()
             model_instance.feature_columns = loaded_data['feature_columns']
-            model_instance.config = loaded_data['config']
+            
+            # Prefer the compiled library when one was saved with the model
+            if os.path.exists(f"{filepath}.so"):
+                try:
+                    import tl2cgen
+                    model_instance._compiled_predictor = tl2cgen.Predictor(
+                        f"{filepath}.so", nthread=os.cpu_count()
+                    )
+                except ImportError:
+                    pass
             
             return model_instance
         except Exception as e:
             logging.error(f"Model loading failed: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    @staticmethod
+    def model_filename(
+        sport: str, 
+        prediction_type: str, 
+        feature_columns: List[str]
+    ) -> str:
+        """
+        Path prefix for the specialised model of a sport and prop type
+        
+        The feature set is hashed into the name so that a model trained on
+        different columns is never picked up by mistake.
+        
+        Args:
+            sport (str): Sport type
+            prediction_type (str): Type of prop
+            feature_columns (List[str]): Model input columns, in order
+        
+        Returns:
+            File name prefix (without extension)
+        """
+        digest = hashlib.blake2b(
+            repr((sport, prediction_type, tuple(feature_columns))).encode(), 
+            digest_size=8
+        ).hexdigest()
+        return f"player_prop_{sport}_{prediction_type}_{digest}"
+    
+    def save_specialised_model(self, model_dir: str = 'models') -> str:
+        """
+        Save the model under the name ``get`` looks it up by
+        
+        Args:
+            model_dir (str): Directory holding the saved models
+        
+        Returns:
+            Path prefix the model was saved under
+        """
+        os.makedirs(model_dir, exist_ok=True)
+        filepath = os.path.join(
+            model_dir, 
+            self.model_filename(self.sport, self.prediction_type, self.feature_columns)
+        )
+        self.save_model(filepath)
+        return filepath
+    
+    @classmethod
+    def get(
+        cls, 
+        sport: str = 'basketball', 
+        prediction_type: str = 'points',
+        model_dir: str = 'models',
+        feature_columns: Optional[List[str]] = None
+    ) -> 'PlayerPropPredictionModel':
+        """
+        Return the trained model for a sport and prop type, loading it once
+        
+        Models are written for this lookup by ``save_specialised_model``.
+        Subsequent calls in the same process reuse the loaded instance
+        instead of reading the model files again.
+        
+        Args:
+            sport (str): Sport type
+            prediction_type (str): Type of prop
+            model_dir (str): Directory holding the saved models
+            feature_columns (Optional[List[str]]): Model input columns;
+                defaults to ``DEFAULT_FEATURE_COLUMNS``
+        
+        Returns:
+            Loaded PlayerPropPredictionModel
+        """
+        columns = tuple(feature_columns or cls.DEFAULT_FEATURE_COLUMNS)
+        key = (sport, prediction_type, columns)
+        
+        with cls._MODEL_CACHE_LOCK:
+            model_instance = cls._MODEL_CACHE.get(key)
+            if model_instance is None:
+                model_instance = cls.load_model(os.path.join(
+                    model_dir, cls.model_filename(sport, prediction_type, columns)
+                ))
+                cls._MODEL_CACHE[key] = model_instance
+        
+        return model_instance
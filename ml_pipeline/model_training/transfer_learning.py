@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 import numpy as np
@@ -5,7 +6,19 @@ import pandas as pd
 import tensorflow as tf
 from typing import Dict, Any, List, Tuple
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
+
+try:
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa_csv = None
+    pq = None
+
+try:
+    import cudf
+    import cupy as cp
+except ImportError:
+    cudf = None
 
 # Configure comprehensive logging
 logging.basicConfig(
@@ -18,6 +31,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keras 3 (TensorFlow >= 2.16) changed the checkpoint callback API
+_KERAS_3 = int(tf.keras.__version__.split('.')[0]) >= 3
+
+
+def convert_csv_to_parquet(csv_path: str, parquet_path: str = None) -> str:
+    """
+    One-shot conversion of a training CSV to Parquet.
+    
+    Args:
+        csv_path (str): Path to the source CSV file
+        parquet_path (str, optional): Destination path; defaults to the CSV
+            path with a ``.parquet`` extension
+    
+    Returns:
+        Path to the written Parquet file
+    """
+    parquet_path = parquet_path or os.path.splitext(csv_path)[0] + '.parquet'
+    
+    if pa_csv is not None:
+        pq.write_table(pa_csv.read_csv(csv_path), parquet_path)
+    else:
+        pd.read_csv(csv_path).to_parquet(parquet_path, index=False)
+    
+    logger.info(f"Converted {csv_path} to {parquet_path}")
+    return parquet_path
+
+class _AssembledModelCheckpoint(tf.keras.callbacks.ModelCheckpoint):
+    """
+    ModelCheckpoint that saves a fixed model instead of the one being fit.
+    
+    Used when only the head is fit on precomputed features, so checkpoints
+    still hold the full base + head model.
+    """
+    
+    def __init__(self, saved_model: tf.keras.Model, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._saved_model = saved_model
+    
+    def set_model(self, model):
+        super().set_model(self._saved_model)
+
 class TransferLearningPredictor:
     def __init__(self, config: Dict[str, Any]):
         """
@@ -29,7 +83,14 @@ class TransferLearningPredictor:
         self.config = config
         self.base_model = None
         self.transfer_model = None
-        self.scaler = StandardScaler()
+        
+        # Per-feature statistics fitted at load time, applied in-graph by a
+        # Normalization layer in front of the base model
+        self.feature_mean = None
+        self.feature_var = None
+        
+        # Distribution strategy the models are built under (set by the pipeline)
+        self.strategy = None
         
         # Set random seeds for reproducibility
         np.random.seed(self.config.get('random_seed', 42))
@@ -80,6 +141,11 @@ class TransferLearningPredictor:
         """
         Prepare transfer learning model by adding custom layers.
         
+        The head is built as its own model (the last layer of the returned
+        model) so it can also be trained directly on precomputed backbone
+        features. Once feature statistics are fitted, a Normalization layer
+        standardizes the raw inputs in-graph ahead of the base model.
+        
         Args:
             base_model (tf.keras.Model): Pre-trained base model
             input_shape (Tuple[int, ...]): Input data shape
@@ -92,30 +158,16 @@ class TransferLearningPredictor:
             logger.info("Preparing transfer learning model architecture")
             
             # Create transfer learning model
-            transfer_model = tf.keras.Sequential([
-                base_model,
-                tf.keras.layers.GlobalAveragePooling2D(),
-                tf.keras.layers.Dense(
-                    self.config.get('dense_units', 128), 
-                    activation='relu'
-                ),
-                tf.keras.layers.Dropout(
-                    self.config.get('dropout_rate', 0.5)
-                ),
-                tf.keras.layers.Dense(
-                    num_classes, 
-                    activation='softmax'
-                )
-            ])
-            
-            # Compile model with configured optimizer and loss
-            transfer_model.compile(
-                optimizer=tf.keras.optimizers.Adam(
-                    learning_rate=self.config.get('learning_rate', 0.0001)
-                ),
-                loss=self.config.get('loss_function', 'categorical_crossentropy'),
-                metrics=['accuracy']
-            )
+            head = self.prepare_head_model(base_model.output_shape[1:], num_classes)
+            layers = [base_model, head]
+            if self.feature_mean is not None:
+                # Constant features keep a unit variance, matching sklearn
+                layers.insert(0, tf.keras.layers.Normalization(
+                    mean=self.feature_mean,
+                    variance=np.where(self.feature_var == 0.0, 1.0, self.feature_var)
+                ))
+            transfer_model = tf.keras.Sequential(layers)
+            self._compile_model(transfer_model)
             
             logger.info("Transfer learning model prepared successfully")
             return transfer_model
@@ -124,6 +176,136 @@ class TransferLearningPredictor:
             logger.error(f"Error preparing transfer learning model: {e}")
             raise
     
+    def prepare_head_model(
+        self, 
+        feature_shape: Tuple[int, ...], 
+        num_classes: int
+    ) -> tf.keras.Model:
+        """
+        Build and compile the trainable classification head.
+        
+        Args:
+            feature_shape (Tuple[int, ...]): Shape of one backbone output
+            num_classes (int): Number of output classes
+        
+        Returns:
+            Head model taking backbone features as input
+        """
+        # Mixed precision head: float16 on GPU, bfloat16 on CPU. The policy
+        # is set per layer so the frozen base and other models keep theirs.
+        use_gpu = bool(tf.config.list_physical_devices('GPU'))
+        policy = 'mixed_float16' if use_gpu else 'mixed_bfloat16'
+        
+        head = tf.keras.Sequential([
+            tf.keras.Input(shape=feature_shape),
+            tf.keras.layers.GlobalAveragePooling2D(),
+            tf.keras.layers.Dense(
+                self.config.get('dense_units', 128), 
+                activation='relu',
+                dtype=policy
+            ),
+            tf.keras.layers.Dropout(
+                self.config.get('dropout_rate', 0.5),
+                dtype=policy
+            ),
+            # Keep the logits and softmax in float32 for numerical stability
+            tf.keras.layers.Dense(num_classes, dtype='float32'),
+            tf.keras.layers.Activation('softmax', dtype='float32')
+        ], name='transfer_head')
+        
+        self._compile_model(head)
+        return head
+    
+    def _compile_model(self, model: tf.keras.Model) -> None:
+        """
+        Compile a model with the configured optimizer and loss.
+        
+        Args:
+            model (tf.keras.Model): Model to compile
+        """
+        optimizer = tf.keras.optimizers.Adam(
+            learning_rate=self.config.get('learning_rate', 0.0001)
+        )
+        if tf.config.list_physical_devices('GPU'):
+            # float16 gradients need loss scaling to avoid underflow
+            optimizer = tf.keras.mixed_precision.LossScaleOptimizer(optimizer)
+        
+        model.compile(
+            optimizer=optimizer,
+            loss=self.config.get('loss_function', 'categorical_crossentropy'),
+            metrics=['accuracy'],
+            # XLA fuses the head's Dense/ReLU/Dropout/softmax into one cluster
+            jit_compile=True
+        )
+    
+    def _feature_cache_prefix(
+        self, 
+        pretrained_model_path: str, 
+        data_path: str, 
+        features: List[str], 
+        target: str
+    ) -> str:
+        """
+        Cache path prefix for precomputed backbone features.
+        
+        The key covers both input files (path, size and mtime) and every
+        setting that changes the split, so stale features are never reused.
+        
+        Args:
+            pretrained_model_path (str): Path to pre-trained model
+            data_path (str): Path to training data
+            features (List[str]): Feature columns
+            target (str): Target column
+        
+        Returns:
+            Path prefix under ``config['feature_cache_dir']``, or None when
+            feature caching is disabled
+        """
+        cache_dir = self.config.get('feature_cache_dir')
+        if not cache_dir:
+            return None
+        
+        key = hashlib.blake2b(digest_size=16)
+        for path in (pretrained_model_path, data_path):
+            stat = os.stat(path)
+            key.update(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        key.update(repr((
+            features, 
+            target, 
+            self.config.get('test_size', 0.2), 
+            self.config.get('random_seed', 42)
+        )).encode())
+        
+        return os.path.join(cache_dir, f"backbone_features_{key.hexdigest()}")
+    
+    def _backbone_features(self, X: np.ndarray, cache_path: str = None) -> np.ndarray:
+        """
+        Run the frozen layers ahead of the head once over ``X``, reusing a
+        cached result.
+        
+        Args:
+            X (np.ndarray): Model inputs
+            cache_path (str, optional): ``.npy`` file to load from or save to
+        
+        Returns:
+            Backbone outputs for every row of ``X``
+        """
+        if cache_path and os.path.exists(cache_path):
+            logger.info(f"Loading cached backbone features from {cache_path}")
+            return np.load(cache_path)
+        
+        # Everything in front of the head: normalization and the base model
+        backbone = tf.keras.Sequential(self.transfer_model.layers[:-1])
+        feats = backbone.predict(
+            X, batch_size=self.config.get('feature_batch_size', 256), verbose=0
+        )
+        
+        if cache_path:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            np.save(cache_path, feats)
+        
+        return feats
+    
     def load_and_preprocess_data(
         self, 
         data_path: str, 
@@ -133,6 +315,18 @@ class TransferLearningPredictor:
         """
         Load and preprocess data for transfer learning.
         
+        The CSV is streamed twice in chunks of ``config['chunksize']`` rows:
+        the first pass accumulates feature statistics and collects the target
+        classes, the second writes raw features and one-hot targets straight
+        into preallocated float32 arrays. Peak memory is bounded by the chunk
+        size rather than by intermediate DataFrames. The fitted statistics are
+        stored on ``self.feature_mean``/``self.feature_var`` and applied by the
+        model's Normalization layer rather than on the host.
+        When cuDF is installed and ``config['use_gpu']`` is not disabled, the
+        file is instead read and reduced on the GPU in one pass.
+        Parquet files (``.parquet``, see ``convert_csv_to_parquet``) read only
+        the feature and target columns.
+        
         Args:
             data_path (str): Path to training data
             features (List[str]): List of feature columns
@@ -144,22 +338,14 @@ class TransferLearningPredictor:
         try:
             logger.info(f"Loading data from {data_path}")
             
-            # Load data
-            df = pd.read_csv(data_path)
-            
-            # Validate data
-            if df.empty:
-                raise ValueError("Loaded dataset is empty")
-            
-            X = df[features]
-            y = pd.get_dummies(df[target])  # One-hot encode target
-            
-            # Scale features
-            X_scaled = self.scaler.fit_transform(X)
+            if cudf is not None and self.config.get('use_gpu', True):
+                X, y = self._load_gpu(data_path, features, target)
+            else:
+                X, y = self._load_chunked(data_path, features, target)
             
             # Split data
             X_train, X_test, y_train, y_test = train_test_split(
-                X_scaled, 
+                X, 
                 y, 
                 test_size=self.config.get('test_size', 0.2),
                 random_state=self.config.get('random_seed', 42)
@@ -172,12 +358,137 @@ class TransferLearningPredictor:
             logger.error(f"Error loading and preprocessing data: {e}")
             raise
     
+    def _load_chunked(
+        self, 
+        data_path: str, 
+        features: List[str], 
+        target: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Two-pass chunked CPU load returning raw features and one-hot targets.
+        
+        Args:
+            data_path (str): Path to training data
+            features (List[str]): List of feature columns
+            target (str): Target column name
+        
+        Returns:
+            Raw float32 features and one-hot float32 targets
+        """
+        columns = features + [target]
+        chunksize = self.config.get('chunksize', 2**16)
+        
+        def read_chunks():
+            if data_path.endswith('.parquet'):
+                if pq is None:
+                    return [pd.read_parquet(data_path, columns=columns)]
+                # Column-projected record batches, decoded by Arrow's thread pool
+                return (
+                    batch.to_pandas() for batch in 
+                    pq.ParquetFile(data_path).iter_batches(batch_size=chunksize, columns=columns)
+                )
+            return pd.read_csv(
+                data_path,
+                usecols=columns,
+                dtype={feature: np.float32 for feature in features},
+                chunksize=chunksize
+            )
+        
+        # First pass: float64 feature sums, row count and target classes
+        n_rows = 0
+        classes = set()
+        n_valid = np.zeros(len(features), dtype=np.int64)
+        feature_sum = np.zeros(len(features), dtype=np.float64)
+        feature_sum_sq = np.zeros(len(features), dtype=np.float64)
+        for chunk in read_chunks():
+            block = chunk[features].to_numpy(dtype=np.float64)
+            n_valid += (~np.isnan(block)).sum(axis=0)
+            feature_sum += np.nansum(block, axis=0)
+            feature_sum_sq += np.nansum(block * block, axis=0)
+            classes.update(chunk[target].dropna().unique())
+            n_rows += len(chunk)
+        
+        # Validate data
+        if n_rows == 0:
+            raise ValueError("Loaded dataset is empty")
+        
+        # Same column order as pd.get_dummies
+        self.class_labels = sorted(classes)
+        class_index = pd.Index(self.class_labels)
+        
+        mean = feature_sum / np.maximum(n_valid, 1)
+        self.feature_mean = mean
+        self.feature_var = np.maximum(feature_sum_sq / np.maximum(n_valid, 1) - mean * mean, 0.0)
+        
+        # Second pass: copy features and one-hot encode target in place
+        X = np.empty((n_rows, len(features)), dtype=np.float32)
+        y = np.zeros((n_rows, len(self.class_labels)), dtype=np.float32)
+        offset = 0
+        for chunk in read_chunks():
+            end = offset + len(chunk)
+            X[offset:end] = chunk[features].to_numpy(dtype=np.float32)
+            
+            codes = class_index.get_indexer(chunk[target])
+            rows = np.arange(offset, end)
+            y[rows[codes >= 0], codes[codes >= 0]] = 1.0
+            offset = end
+        
+        return X, y
+    
+    def _load_gpu(
+        self, 
+        data_path: str, 
+        features: List[str], 
+        target: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Single-pass cuDF load with feature statistics reduced on the device.
+        
+        Args:
+            data_path (str): Path to training data
+            features (List[str]): List of feature columns
+            target (str): Target column name
+        
+        Returns:
+            Raw float32 features and one-hot float32 targets
+        """
+        if data_path.endswith('.parquet'):
+            gdf = cudf.read_parquet(data_path, columns=features + [target])
+        else:
+            gdf = cudf.read_csv(
+                data_path,
+                usecols=features + [target],
+                dtype={feature: 'float32' for feature in features}
+            )
+        
+        # Validate data
+        if len(gdf) == 0:
+            raise ValueError("Loaded dataset is empty")
+        
+        # float64 reductions on the device; only the statistics come back to host
+        block = gdf[features].to_cupy(dtype=cp.float64, na_value=cp.nan)
+        n_valid = (~cp.isnan(block)).sum(axis=0)
+        mean = cp.nansum(block, axis=0) / cp.maximum(n_valid, 1)
+        var = cp.maximum(cp.nansum(block * block, axis=0) / cp.maximum(n_valid, 1) - mean * mean, 0.0)
+        self.feature_mean, self.feature_var = cp.asnumpy(mean), cp.asnumpy(var)
+        
+        # Same column order as pd.get_dummies
+        self.class_labels = gdf[target].dropna().unique().sort_values().to_arrow().to_pylist()
+        codes = cp.asarray(cudf.Index(self.class_labels).get_indexer(gdf[target]))
+        y = cp.zeros((len(gdf), len(self.class_labels)), dtype=cp.float32)
+        rows = cp.arange(len(gdf))
+        y[rows[codes >= 0], codes[codes >= 0]] = 1.0
+        
+        return cp.asnumpy(block.astype(cp.float32)), cp.asnumpy(y)
+    
     def train_transfer_model(
         self, 
         X_train: np.ndarray, 
         y_train: np.ndarray,
         X_test: np.ndarray, 
-        y_test: np.ndarray
+        y_test: np.ndarray,
+        model: tf.keras.Model = None,
+        checkpoint_model: tf.keras.Model = None
     ) -> tf.keras.Model:
         """
         Train transfer learning model.
@@ -185,12 +496,17 @@ class TransferLearningPredictor:
         Args:
             X_train, y_train: Training data
             X_test, y_test: Test data
+            model (tf.keras.Model, optional): Model to train; defaults to
+                ``self.transfer_model``
+            checkpoint_model (tf.keras.Model, optional): Model whose weights
+                are checkpointed; defaults to ``model``
         
         Returns:
             Trained transfer learning model
         """
         try:
             logger.info("Starting transfer learning model training")
+            model = model or self.transfer_model
             
             # Early stopping and model checkpointing
             early_stopping = tf.keras.callbacks.EarlyStopping(
@@ -199,26 +515,76 @@ class TransferLearningPredictor:
                 restore_best_weights=True
             )
             
-            model_checkpoint = tf.keras.callbacks.ModelCheckpoint(
-                'best_transfer_model.h5', 
-                save_best_only=True
+            checkpoint_model = checkpoint_model or model
+            if _KERAS_3:
+                # Keras 3 takes no checkpoint options and requires the
+                # .weights.h5 suffix for weights-only saves
+                model_checkpoint = _AssembledModelCheckpoint(
+                    checkpoint_model,
+                    'best_transfer_model.weights.h5', 
+                    save_best_only=True,
+                    save_weights_only=True
+                )
+            else:
+                # Weights-only TF checkpoint; variables are snapshotted to host
+                # memory and written on a background thread so training continues
+                model_checkpoint = _AssembledModelCheckpoint(
+                    checkpoint_model,
+                    'best_transfer_model', 
+                    save_best_only=True,
+                    save_weights_only=True,
+                    options=tf.train.CheckpointOptions(
+                        experimental_enable_async_checkpoint=True
+                    )
+                )
+            
+            # Global batch grows with the number of synchronized replicas
+            strategy = self.strategy or tf.distribute.get_strategy()
+            global_batch_size = (
+                self.config.get('per_replica_batch_size', 64) 
+                * strategy.num_replicas_in_sync
+            )
+            
+            # Input pipeline: tensors cached once, reshuffled in-graph each
+            # epoch and prefetched so host-to-device copies overlap compute
+            options = tf.data.Options()
+            options.experimental_optimization.map_and_batch_fusion = True
+            
+            # Equal per-replica batches only matter across replicas, and a
+            # training set smaller than one global batch must keep its rows
+            drop_remainder = (
+                strategy.num_replicas_in_sync > 1 and len(X_train) >= global_batch_size
+            )
+            train_ds = (
+                tf.data.Dataset.from_tensor_slices((X_train, y_train))
+                .cache()
+                .shuffle(buffer_size=len(X_train), reshuffle_each_iteration=True)
+                .batch(global_batch_size, drop_remainder=drop_remainder)
+                .prefetch(tf.data.AUTOTUNE)
+                .with_options(options)
+            )
+            val_ds = (
+                tf.data.Dataset.from_tensor_slices((X_test, y_test))
+                .batch(global_batch_size)
+                .cache()
+                .prefetch(tf.data.AUTOTUNE)
+                .with_options(options)
             )
             
-            # Train model
-            history = self.transfer_model.fit(
-                X_train, y_train,
-                validation_data=(X_test, y_test),
+            # Train model; Keras splits each global batch across replicas
+            history = model.fit(
+                train_ds,
+                validation_data=val_ds,
                 epochs=self.config.get('epochs', 50),
-                batch_size=self.config.get('batch_size', 32),
                 callbacks=[early_stopping, model_checkpoint],
                 verbose=1
             )
             
             # Evaluate model
-            test_loss, test_accuracy = self.transfer_model.evaluate(X_test, y_test)
+            test_loss, test_accuracy = model.evaluate(val_ds)
             logger.info(f"Test Loss: {test_loss}, Test Accuracy: {test_accuracy}")
             
-            return self.transfer_model
+            return model
         
         except Exception as e:
             logger.error(f"Error during transfer learning training: {e}")
@@ -243,8 +609,13 @@ class TransferLearningPredictor:
         try:
             logger.info("Starting Transfer Learning Pipeline")
             
+            # Mirror variables across all local GPUs (or the CPU when none)
+            self.strategy = tf.distribute.MirroredStrategy()
+            logger.info(f"Training on {self.strategy.num_replicas_in_sync} replica(s)")
+            
             # Load pre-trained base model
-            self.base_model = self.load_pretrained_model(pretrained_model_path)
+            with self.strategy.scope():
+                self.base_model = self.load_pretrained_model(pretrained_model_path)
             
             # Load and preprocess data
             X_train, X_test, y_train, y_test = self.load_and_preprocess_data(
@@ -252,16 +623,37 @@ class TransferLearningPredictor:
             )
             
             # Prepare transfer learning model
-            self.transfer_model = self.prepare_transfer_learning_model(
-                self.base_model, 
-                input_shape=X_train.shape[1:], 
-                num_classes=y_train.shape[1]
-            )
+            with self.strategy.scope():
+                self.transfer_model = self.prepare_transfer_learning_model(
+                    self.base_model, 
+                    input_shape=X_train.shape[1:], 
+                    num_classes=y_train.shape[1]
+                )
             
             # Train transfer model
-            trained_model = self.train_transfer_model(
-                X_train, y_train, X_test, y_test
-            )
+            if self.config.get('precompute_features', True):
+                # The backbone is frozen, so its outputs are computed once and
+                # only the head (which shares its layers with the full model)
+                # is trained on them
+                cache_prefix = self._feature_cache_prefix(
+                    pretrained_model_path, data_path, features, target
+                )
+                train_feats = self._backbone_features(
+                    X_train, cache_prefix and f"{cache_prefix}_train.npy"
+                )
+                test_feats = self._backbone_features(
+                    X_test, cache_prefix and f"{cache_prefix}_test.npy"
+                )
+                self.train_transfer_model(
+                    train_feats, y_train, test_feats, y_test,
+                    model=self.transfer_model.layers[-1],
+                    checkpoint_model=self.transfer_model
+                )
+                trained_model = self.transfer_model
+            else:
+                trained_model = self.train_transfer_model(
+                    X_train, y_train, X_test, y_test
+                )
             
             logger.info("Transfer Learning Pipeline Completed Successfully")
             return trained_model
@@ -277,7 +669,7 @@ def main():
         'test_size': 0.2,
         'learning_rate': 0.0001,
         'epochs': 50,
-        'batch_size': 32,
+        'per_replica_batch_size': 64,
         'dense_units': 128,
         'dropout_rate': 0.5,
         'loss_function': 'categorical_crossentropy'
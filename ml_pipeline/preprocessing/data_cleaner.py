@@ -1,7 +1,108 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union
 import logging
+from joblib import Parallel, delayed
+
+
+def _nan_median(values: np.ndarray) -> float:
+    """
+    Median of the non-NaN entries via linear-time selection instead of a sort.
+    
+    Args:
+        values (np.ndarray): 1-D float array
+    
+    Returns:
+        float: Median (mean of the two middle values for an even count), or
+        NaN if no values are present
+    """
+    valid = values[~np.isnan(values)]
+    n = valid.size
+    if n == 0:
+        return np.nan
+    k = n // 2
+    if n % 2:
+        valid.partition(k)
+        return valid[k]
+    valid.partition((k - 1, k))
+    return 0.5 * (valid[k - 1] + valid[k])
+
+
+def _mode(series: pd.Series):
+    """
+    Most frequent non-missing value, smallest first on ties as Series.mode().
+    
+    Args:
+        series (pd.Series): Input column
+    
+    Returns:
+        Mode value, or None if the column has no non-missing values
+    """
+    codes, uniques = pd.factorize(series, sort=True)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    return uniques[counts.argmax()] if counts.size else None
+
+
+def _clean_one_numeric(series: pd.Series, config: Dict[str, Any]) -> pd.Series:
+    """
+    Apply one column's numeric cleaning configuration through pandas.
+    
+    Used for integer, boolean and extension-dtype columns, which the
+    float block path in ``clean_numeric_columns`` does not cover.
+    
+    Args:
+        series (pd.Series): Input column
+        config (Dict): Cleaning configuration for the column
+    
+    Returns:
+        pd.Series: Cleaned column
+    """
+    # Handle missing values
+    if config.get('fill_method', 'zero') == 'zero':
+        series = series.fillna(0)
+    elif config.get('fill_method') == 'median':
+        series = series.fillna(series.median())
+    
+    # Apply range constraints
+    if 'min_value' in config or 'max_value' in config:
+        series = series.clip(lower=config.get('min_value'), upper=config.get('max_value'))
+    
+    # Data type conversion
+    if config.get('convert_to'):
+        series = series.astype(config['convert_to'])
+    
+    return series
+
+
+def _clean_one_categorical(series: pd.Series, config: Dict[str, Any]) -> pd.Series:
+    """
+    Apply one column's categorical cleaning configuration.
+    
+    Args:
+        series (pd.Series): Input column
+        config (Dict): Cleaning configuration for the column
+    
+    Returns:
+        pd.Series: Cleaned column
+    """
+    # Handle missing values
+    if config.get('fill_method') == 'mode':
+        mode = _mode(series)
+        if mode is not None:
+            series = series.fillna(mode)
+    elif config.get('fill_method') == 'unknown':
+        series = series.fillna('Unknown')
+    
+    # Standardize case
+    if config.get('lowercase', False):
+        series = series.str.lower()
+    
+    # Replace values
+    if config.get('replacements'):
+        series = series.replace(config['replacements'])
+    
+    return series
+
 
 class DataCleaner:
     def __init__(self, logger: Optional[logging.Logger] = None):
@@ -24,26 +125,70 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Cleaned DataFrame
         """
+        # Float columns are grouped by working dtype (a NumPy float target,
+        # else their own dtype) so each group is cleaned as one block
+        groups: Dict[np.dtype, list] = {}
         for column, config in numeric_columns.items():
             if column not in df.columns:
                 self.logger.warning(f"Column {column} not found in DataFrame")
                 continue
+            source_dtype = df[column].dtype
+            if not (isinstance(source_dtype, np.dtype) and source_dtype.kind == 'f'):
+                # Integer, boolean and extension dtypes keep pandas semantics
+                df[column] = _clean_one_numeric(df[column], config)
+                continue
+            target_dtype = pd.api.types.pandas_dtype(config.get('convert_to') or source_dtype)
+            work_dtype = (
+                target_dtype if isinstance(target_dtype, np.dtype) and target_dtype.kind == 'f' 
+                else source_dtype
+            )
+            groups.setdefault(work_dtype, []).append(column)
+        
+        for work_dtype, cols in groups.items():
+            arr = df[cols].to_numpy(dtype=work_dtype, copy=True)
+            configs = [numeric_columns[column] for column in cols]
             
-            # Handle missing values
-            if config.get('fill_method', 'zero') == 'zero':
-                df[column] = df[column].fillna(0)
-            elif config.get('fill_method') == 'median':
-                df[column] = df[column].fillna(df[column].median())
+            # Per-column fill values; NaN leaves the column's gaps untouched
+            fill_vals = np.full(len(cols), np.nan, dtype=work_dtype)
+            median_idx = []
+            for j, config in enumerate(configs):
+                fill_method = config.get('fill_method', 'zero')
+                if fill_method == 'zero':
+                    fill_vals[j] = 0
+                elif fill_method == 'median':
+                    median_idx.append(j)
+            if median_idx:
+                # Selection runs in NumPy without the GIL, so columns use threads
+                fill_vals[median_idx] = Parallel(n_jobs=-1, prefer='threads')(
+                    delayed(_nan_median)(arr[:, j]) for j in median_idx
+                )
             
-            # Apply range constraints
-            if 'min_value' in config:
-                df[column] = df[column].clip(lower=config['min_value'])
-            if 'max_value' in config:
-                df[column] = df[column].clip(upper=config['max_value'])
+            # Range constraints, unbounded where not configured
+            lo = np.array([config.get('min_value', -np.inf) for config in configs], dtype=work_dtype)
+            hi = np.array([config.get('max_value', np.inf) for config in configs], dtype=work_dtype)
             
-            # Data type conversion
-            if config.get('convert_to'):
-                df[column] = df[column].astype(config['convert_to'])
+            # Fill and clip in place on the single contiguous buffer
+            np.copyto(arr, np.broadcast_to(fill_vals, arr.shape), where=np.isnan(arr))
+            np.clip(arr, lo, hi, out=arr)
+            
+            # Columns kept at the working dtype go back as one block; other
+            # targets (integer, category, nullable, ...) are cast per column
+            block = []
+            for j, (column, config) in enumerate(zip(cols, configs)):
+                convert_to = config.get('convert_to')
+                target_dtype = pd.api.types.pandas_dtype(convert_to) if convert_to else work_dtype
+                if target_dtype == work_dtype:
+                    block.append(j)
+                    continue
+                if (isinstance(target_dtype, np.dtype) and target_dtype.kind in 'iub' 
+                        and np.isnan(arr[:, j]).any()):
+                    raise ValueError(
+                        f"Column {column} still has missing values; cannot convert to {target_dtype}"
+                    )
+                df[column] = pd.Series(arr[:, j], index=df.index, name=column).astype(convert_to)
+            
+            if block:
+                df[[cols[j] for j in block]] = arr[:, block]
         
         return df
     
@@ -58,24 +203,20 @@ class DataCleaner:
         Returns:
             pd.DataFrame: Cleaned DataFrame
         """
-        for column, config in categorical_columns.items():
+        columns = []
+        for column in categorical_columns:
             if column not in df.columns:
                 self.logger.warning(f"Column {column} not found in DataFrame")
                 continue
-            
-            # Handle missing values
-            if config.get('fill_method') == 'mode':
-                df[column] = df[column].fillna(df[column].mode()[0])
-            elif config.get('fill_method') == 'unknown':
-                df[column] = df[column].fillna('Unknown')
-            
-            # Standardize case
-            if config.get('lowercase', False):
-                df[column] = df[column].str.lower()
-            
-            # Replace values
-            if config.get('replacements'):
-                df[column] = df[column].replace(config['replacements'])
+            columns.append(column)
+        
+        # Columns are independent, so each is cleaned on its own thread
+        results = Parallel(n_jobs=-1, prefer='threads')(
+            delayed(_clean_one_categorical)(df[column], categorical_columns[column])
+            for column in columns
+        )
+        for column, series in zip(columns, results):
+            df[column] = series
         
         return df
     
@@ -91,7 +232,20 @@ class DataCleaner:
             pd.DataFrame: DataFrame with duplicates removed
         """
         initial_rows = len(df)
-        df = df.drop_duplicates(subset=subset)
+        
+        # One vectorized 64-bit hash per row. Rows with a unique hash are
+        # unique; only rows sharing a hash are compared by value, so a hash
+        # collision never drops a distinct row. The first occurrence of each
+        # duplicate is kept in original row order, as with drop_duplicates
+        key_frame = df[subset] if subset else df
+        keys = pd.util.hash_pandas_object(key_frame, index=False).to_numpy()
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        shared = counts[inverse] > 1
+        keep = ~shared
+        shared_rows = np.flatnonzero(shared)
+        if shared_rows.size:
+            keep[shared_rows[~key_frame.iloc[shared_rows].duplicated().to_numpy()]] = True
+        df = df.iloc[np.flatnonzero(keep)]
         removed_rows = initial_rows - len(df)
         
         if removed_rows > 0:
@@ -99,10 +253,48 @@ class DataCleaner:
         
         return df
     
+    def to_arrays(self, 
+                  df: pd.DataFrame, 
+                  numeric_columns: list, 
+                  categorical_columns: list) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        """
+        Split a cleaned DataFrame into contiguous per-kind column arrays.
+        
+        Args:
+            df (pd.DataFrame): Cleaned DataFrame
+            numeric_columns (list): Numeric columns to place in ``X_num``
+            categorical_columns (list): Categorical columns to encode into ``X_cat``
+        
+        Returns:
+            Tuple: ``X_num`` (float32, rows x numeric), ``X_cat`` (int32 codes,
+            rows x categorical; -1 for missing) and a ``col_schema`` dict mapping
+            column names to indices plus the categories behind each code
+        """
+        num_cols = [column for column in numeric_columns if column in df.columns]
+        cat_cols = [column for column in categorical_columns if column in df.columns]
+        
+        X_num = np.ascontiguousarray(df[num_cols].to_numpy(dtype=np.float32))
+        
+        X_cat = np.empty((len(df), len(cat_cols)), dtype=np.int32)
+        categories = {}
+        for j, column in enumerate(cat_cols):
+            codes, uniques = pd.factorize(df[column], sort=False)
+            X_cat[:, j] = codes
+            categories[column] = uniques.tolist()
+        
+        col_schema = {
+            'numeric': {column: j for j, column in enumerate(num_cols)},
+            'categorical': {column: j for j, column in enumerate(cat_cols)},
+            'categories': categories
+        }
+        
+        return X_num, X_cat, col_schema
+    
     def clean_data(self, 
                    df: pd.DataFrame, 
                    numeric_columns: Dict[str, Dict[str, Any]], 
-                   categorical_columns: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+                   categorical_columns: Dict[str, Dict[str, Any]],
+                   as_arrays: bool = False) -> Union[pd.DataFrame, Tuple[np.ndarray, np.ndarray, Dict[str, Any]]]:
         """
         Comprehensive data cleaning pipeline.
         
@@ -110,14 +302,20 @@ class DataCleaner:
             df (pd.DataFrame): Input DataFrame
             numeric_columns (Dict): Configuration for numeric columns
             categorical_columns (Dict): Configuration for categorical columns
+            as_arrays (bool): Return ``(X_num, X_cat, col_schema)`` from
+                ``to_arrays`` instead of a DataFrame
         
         Returns:
-            pd.DataFrame: Fully cleaned DataFrame
+            pd.DataFrame: Fully cleaned DataFrame, or the array split when
+            ``as_arrays`` is set
         """
         df = self.remove_duplicates(df)
         df = self.clean_numeric_columns(df, numeric_columns)
         df = self.clean_categorical_columns(df, categorical_columns)
         
+        if as_arrays:
+            return self.to_arrays(df, list(numeric_columns), list(categorical_columns))
+        
         return df
 
 # Example usage and configuration
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Optional
 import logging
+import warnings
 import jsonschema
 
 class DataValidator:
@@ -26,6 +27,13 @@ class DataValidator:
             bool: Whether the DataFrame passes schema validation
         """
         try:
+            # Dtype lookups resolved once for the whole frame
+            is_numeric = {
+                column: pd.api.types.is_numeric_dtype(dtype)
+                for column, dtype in df.dtypes.items()
+            }
+            range_checks = []
+            
             for column, column_schema in schema.get('properties', {}).items():
                 if column not in df.columns:
                     if column_schema.get('required', False):
@@ -35,18 +43,28 @@ class DataValidator:
                 # Type checking
                 dtype = column_schema.get('type')
                 if dtype == 'number':
-                    if not pd.api.types.is_numeric_dtype(df[column]):
+                    if not is_numeric[column]:
                         raise TypeError(f"Column {column} must be numeric")
-                
-                # Range constraints
-                if dtype == 'number':
+                    
                     min_val = column_schema.get('minimum')
                     max_val = column_schema.get('maximum')
-                    
-                    if min_val is not None and (df[column] < min_val).any():
+                    if min_val is not None or max_val is not None:
+                        range_checks.append((column, min_val, max_val))
+            
+            # Range constraints from one min/max reduction per column
+            if range_checks:
+                arr = df[[column for column, _, _ in range_checks]].to_numpy(dtype=np.float64, na_value=np.nan)
+                with warnings.catch_warnings():
+                    # All-NaN columns reduce to NaN, which never fails a bound
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    col_min = np.nanmin(arr, axis=0)
+                    col_max = np.nanmax(arr, axis=0)
+                
+                for j, (column, min_val, max_val) in enumerate(range_checks):
+                    if min_val is not None and col_min[j] < min_val:
                         raise ValueError(f"Column {column} has values below {min_val}")
                     
-                    if max_val is not None and (df[column] > max_val).any():
+                    if max_val is not None and col_max[j] > max_val:
                         raise ValueError(f"Column {column} has values above {max_val}")
             
             return True
@@ -89,27 +107,33 @@ class DataValidator:
         Returns:
             Dict: Outliers for each column
         """
-        outliers = {}
+        columns = [
+            column for column in numeric_columns
+            if column in df.columns and pd.api.types.is_numeric_dtype(df[column])
+        ]
+        if not columns or method not in ('iqr', 'zscore'):
+            return {}
         
-        for column in numeric_columns:
-            if column not in df.columns or not pd.api.types.is_numeric_dtype(df[column]):
-                continue
-            
+        # Column-wise reductions over one block instead of per-column pandas calls
+        arr = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
             if method == 'iqr':
-                Q1 = df[column].quantile(0.25)
-                Q3 = df[column].quantile(0.75)
+                # Both quartiles from a single quantile call per column
+                Q1, Q3 = np.nanquantile(arr, [0.25, 0.75], axis=0)
                 IQR = Q3 - Q1
-                
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                column_outliers = df[(df[column] < lower_bound) | (df[column] > upper_bound)]
-                outliers[column] = column_outliers[column].tolist()
-            
-            elif method == 'zscore':
-                z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
-                column_outliers = df[z_scores > 3]
-                outliers[column] = column_outliers[column].tolist()
+                mask = (arr < Q1 - 1.5 * IQR) | (arr > Q3 + 1.5 * IQR)
+            else:
+                # Sample std, matching pandas' Series.std
+                mu = np.nanmean(arr, axis=0)
+                sd = np.nanstd(arr, axis=0, ddof=1)
+                mask = np.abs((arr - mu) / sd) > 3
+        
+        # Report outliers in each column's original dtype
+        outliers = {
+            column: df[column][mask[:, j]].tolist()
+            for j, column in enumerate(columns)
+        }
         
         return outliers
     
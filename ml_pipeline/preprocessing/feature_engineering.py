@@ -10,27 +10,63 @@ def create_categorical_encodings(self, df: pd.DataFrame, categorical_columns: Li
         Returns:
             pd.DataFrame: DataFrame with encoded categorical features
         """
-        encoded_df = df.copy()
+        # Shallow copy: encodings only add or replace whole columns, never
+        # write into the caller's arrays
+        encoded_df = df.copy(deep=False)
         
         if encoding_type == 'onehot':
-            encoded_df = pd.get_dummies(encoded_df, columns=categorical_columns)
+            # Category dtype and sparse indicators store one code per row
+            # rather than a dense N x K block
+            encoded_df = encoded_df.astype({column: 'category' for column in categorical_columns})
+            encoded_df = pd.get_dummies(
+                encoded_df, columns=categorical_columns, sparse=True, dtype=np.uint8
+            )
         
         elif encoding_type == 'label':
-            from sklearn.preprocessing import LabelEncoder
-            label_encoder = LabelEncoder()
-            
+            # One hash pass per column; missing values get their own code
             for column in categorical_columns:
-                encoded_df[f'{column}_encoded'] = label_encoder.fit_transform(encoded_df[column].astype(str))
+                encoded_df[f'{column}_encoded'] = self._encode(encoded_df[column], sort=False)
         
         elif encoding_type == 'ordinal':
-            from sklearn.preprocessing import OrdinalEncoder
-            ordinal_encoder = OrdinalEncoder()
-            
+            # Sorted factorization gives the same codes as OrdinalEncoder
             for column in categorical_columns:
-                encoded_df[f'{column}_ordinal'] = ordinal_encoder.fit_transform(encoded_df[[column]])
+                encoded_df[f'{column}_ordinal'] = self._encode(encoded_df[column], sort=True)
         
         return encoded_df
     
+    def _encode(self, series: pd.Series, sort: bool) -> np.ndarray:
+        """
+        Encode a column against a vocabulary fitted on its first call.
+        
+        The vocabulary is kept per (column, sort) so repeated calls (e.g.
+        streaming inference) do a hashed lookup instead of refitting; values
+        not seen at fit time get code -1.
+        
+        Args:
+            series (pd.Series): Column to encode
+            sort (bool): Whether codes follow sorted category order
+        
+        Returns:
+            np.ndarray: int32 codes
+        """
+        if not hasattr(self, '_encoders'):
+            self._encoders: Dict[Any, pd.Index] = {}
+        
+        key = (series.name, sort)
+        vocabulary = self._encoders.get(key)
+        if vocabulary is None:
+            codes, uniques = pd.factorize(series, sort=sort, use_na_sentinel=False)
+            self._encoders[key] = pd.Index(uniques)
+            return codes.astype(np.int32)
+        
+        return vocabulary.get_indexer(series).astype(np.int32)
+    
+    def reset_encoders(self) -> None:
+        """
+        Drop fitted encoding vocabularies so the next call refits them.
+        """
+        self._encoders = {}
+    
     def engineer_features(self, 
                            df: pd.DataFrame, 
                            config: Dict[str, Any]) -> pd.DataFrame:
@@ -44,7 +80,7 @@ def create_categorical_encodings(self, df: pd.DataFrame, categorical_columns: Li
         Returns:
             pd.DataFrame: DataFrame with engineered features
         """
-        engineered_df = df.copy()
+        engineered_df = df.copy(deep=False)
         
         # Statistical features
         if config.get('statistical_features'):
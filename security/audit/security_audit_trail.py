@@ -1,3 +1,5 @@
+import atexit
+import functools
 import logging
 from datetime import datetime
 import json
@@ -9,54 +11,162 @@ import threading
 import os
 import hmac
 import hashlib
+from typing import Iterable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: dict) -> bytes:
+    """
+    Serialize a log entry to compact UTF-8 JSON in its insertion key order.
+    
+    The stdlib fallback uses the same separators and escaping as orjson so
+    signatures do not depend on which serializer is installed.
+    
+    Args:
+        data (dict): Log entry details
+    
+    Returns:
+        bytes: Serialized entry
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+# Entry fields shared by every event of the same kind from this process;
+# their serialization is signed once and reused as an HMAC prefix
+_TEMPLATE_FIELDS = ('hostname', 'username', 'os', 'event_type', 'description', 'severity')
+
+# Fields that vary from event to event
+_PER_EVENT_FIELDS = ('event_id', 'timestamp', 'process_id', 'thread_id', 'user_id')
+
+# Fixed key order of every entry; signatures serialize fields in this
+# order instead of sorting keys per event
+_CANONICAL_KEYS = _TEMPLATE_FIELDS + _PER_EVENT_FIELDS
+
 
 class SecurityAuditTrail:
-    def __init__(self, audit_log_path: str = 'security_audit.log', secret_key: bytes = None):
+    def __init__(self, 
+                 audit_log_path: str = 'security_audit.log', 
+                 secret_key: bytes = None,
+                 logger_level: Optional[str] = None):
         """
         Initialize comprehensive security audit trail logging system.
         
+        Signed entries are written as JSON lines straight to an
+        ``O_APPEND`` file descriptor, one ``os.write`` per line; the
+        ``logging`` module is only used as an optional secondary sink.
+        
         Args:
             audit_log_path (str): Path to the audit log file
             secret_key (bytes): Optional secret key for log integrity verification
+            logger_level (str, optional): Also forward events at or above this
+                severity to the ``SecurityAuditTrail`` logger
         """
         # Ensure log directory exists
         os.makedirs(os.path.dirname(audit_log_path), exist_ok=True)
         
-        # Thread-safe logging configuration
-        self._lock = threading.Lock()
+        # JSONL audit file; O_APPEND keeps lines from separate processes
+        # whole, the lock orders writers in this process against close()
+        self._fd = os.open(audit_log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o640)
+        self._write_lock = threading.Lock()
+        atexit.register(self.close)
         
-        # Logging setup
+        # Optional logging sink for selected severities
         self.logger = logging.getLogger('SecurityAuditTrail')
-        self.logger.setLevel(logging.INFO)
-        
-        # File handler with secure formatting
-        file_handler = logging.FileHandler(audit_log_path)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(message)s', 
-            datefmt='%Y-%m-%d %H:%M:%S'
+        self._logger_level = (
+            getattr(logging, logger_level.upper()) if logger_level else None
         )
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
         
         # Secret key for log integrity
         self._secret_key = secret_key or os.urandom(32)
+        
+        # Keyed HMAC state (ipad/opad already absorbed), cloned per event
+        self._hmac_template = hmac.new(self._secret_key, b'', hashlib.sha256)
+        
+        # HMAC states primed with recently seen event templates
+        self._template_signer = functools.lru_cache(maxsize=256)(self._prime_signer)
+        
+        # Host, user and OS details do not change over the process lifetime
+        self._hostname = socket.gethostname()
+        self._username = getpass.getuser()
+        self._os_context = {
+            'system': platform.system(),
+            'release': platform.release(),
+            'version': platform.version(),
+            'machine': platform.machine()
+        }
+
+    def flush(self):
+        """
+        Kept for API compatibility; entries are written unbuffered.
+        """
+
+    def close(self):
+        """
+        Close the audit log file once in-flight writes have finished.
+        """
+        with self._write_lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _write_line(self, line: bytes):
+        """
+        Append one serialized entry to the audit log.
+        
+        Args:
+            line (bytes): Entry including its trailing newline
+        """
+        with self._write_lock:
+            if self._fd is None:
+                raise ValueError("Audit trail is closed")
+            
+            # Usually one write; retried from the offset on a short write
+            written = 0
+            with memoryview(line) as view:
+                while written < len(view):
+                    written += os.write(self._fd, view[written:])
+
+    def _prime_signer(self, template: bytes):
+        """
+        Keyed HMAC state that has already absorbed an event template.
+        
+        Args:
+            template (bytes): Serialized template fields
+        
+        Returns:
+            HMAC object to be cloned, never updated in place
+        """
+        signer = self._hmac_template.copy()
+        signer.update(template)
+        return signer
 
     def _generate_log_signature(self, log_data: dict) -> str:
         """
         Generate a cryptographic signature for log integrity.
         
+        The signed message is the JSON of the template fields
+        (``_TEMPLATE_FIELDS``) followed by the JSON of the per-event fields
+        (``_PER_EVENT_FIELDS``), each in that fixed order.
+        
         Args:
             log_data (dict): Log entry details
         
         Returns:
             str: HMAC signature
         """
-        log_string = json.dumps(log_data, sort_keys=True)
-        return hmac.new(
-            self._secret_key, 
-            log_string.encode(), 
-            hashlib.sha256
-        ).hexdigest()
+        template = {field: log_data[field] for field in _TEMPLATE_FIELDS}
+        per_event = {field: log_data[field] for field in _PER_EVENT_FIELDS}
+        
+        # Repeated templates resume from a cached primed state
+        signer = self._template_signer(_dumps(template)).copy()
+        signer.update(_dumps(per_event))
+        return signer.hexdigest()
 
     def _get_system_context(self) -> dict:
         """
@@ -66,18 +176,14 @@ class SecurityAuditTrail:
             dict: Detailed system and user context
         """
         return {
-            'event_id': str(uuid.uuid4()),
+            'event_id': uuid.uuid4().hex,
             'timestamp': datetime.utcnow().isoformat(),
-            'hostname': socket.gethostname(),
-            'username': getpass.getuser(),
+            'hostname': self._hostname,
+            'username': self._username,
+            # Looked up per event so forked workers report their own PID
             'process_id': os.getpid(),
             'thread_id': threading.get_ident(),
-            'os': {
-                'system': platform.system(),
-                'release': platform.release(),
-                'version': platform.version(),
-                'machine': platform.machine()
-            }
+            'os': self._os_context
         }
 
     def log_security_event(self, 
@@ -94,25 +200,45 @@ class SecurityAuditTrail:
             description (str, optional): Event description
             severity (str, optional): Event severity level
         """
-        with self._lock:
-            log_entry = self._get_system_context()
+        self.log_security_events([{
+            'event_type': event_type,
+            'user_id': user_id,
+            'description': description,
+            'severity': severity
+        }])
+
+    def log_security_events(self, events: Iterable[dict]):
+        """
+        Log a batch of security events.
+        
+        Args:
+            events (Iterable[dict]): Events with ``event_type`` and optional
+                ``user_id``, ``description`` and ``severity`` keys
+        """
+        for event in events:
+            # Keys take their canonical positions up front; updates keep them
+            log_entry = dict.fromkeys(_CANONICAL_KEYS)
+            log_entry.update(self._get_system_context())
             
             # Populate event details
             log_entry.update({
-                'event_type': event_type,
-                'user_id': user_id,
-                'description': description,
-                'severity': severity
+                'event_type': event['event_type'],
+                'user_id': event.get('user_id'),
+                'description': event.get('description'),
+                'severity': event.get('severity', 'INFO')
             })
             
             # Generate log signature for integrity
             log_entry['signature'] = self._generate_log_signature(log_entry)
             
             # Log as JSON for structured parsing
-            self.logger.log(
-                getattr(logging, severity.upper()), 
-                json.dumps(log_entry)
-            )
+            line = _dumps(log_entry)
+            self._write_line(line + b'\n')
+            
+            if self._logger_level is not None:
+                level = getattr(logging, log_entry['severity'].upper())
+                if level >= self._logger_level:
+                    self.logger.log(level, line.decode())
 
     def log_authentication_event(self, 
                                  user_id: str, 
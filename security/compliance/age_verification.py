@@ -1,25 +1,173 @@
+import atexit
+import os
+import threading
 from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
 import re
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# ISO (YYYY-MM-DD) or slash-separated (MM/DD/YYYY, DD/MM/YYYY) birthdates
+_DATE_RE = re.compile(r'^(?:(\d{4})-(\d{1,2})-(\d{1,2})|(\d{1,2})/(\d{1,2})/(\d{4}))\Z')
+
+
+def _validate_ages_numpy(years, months, days, today_y, today_m, today_d, min_age, out):
+    """
+    NumPy fallback for the batch age-check kernel.
+    """
+    before_birthday = (months > today_m) | ((months == today_m) & (days > today_d))
+    np.greater_equal(today_y - years.astype(np.int32) - before_birthday, min_age, out=out)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _validate_ages(years, months, days, today_y, today_m, today_d, min_age, out):
+        """
+        Parallel per-user age check writing ``age >= min_age`` into ``out``.
+        """
+        for i in prange(years.shape[0]):
+            age = today_y - years[i]
+            if months[i] > today_m or (months[i] == today_m and days[i] > today_d):
+                age -= 1
+            out[i] = age >= min_age
+else:
+    _validate_ages = _validate_ages_numpy
+
+class AgeVerificationLogger:
+    """
+    Append-only verification log kept open for the process lifetime.
+    
+    Lines are collected in a userspace buffer and written with a single
+    ``os.write`` once it reaches ``FLUSH_BYTES``, on ``flush()``, or at exit.
+    """
+    FLUSH_BYTES = 64 * 1024
+
+    def __init__(self, log_file: str):
+        """
+        Open the log file for appending.
+        
+        Args:
+            log_file (str): Path to log verification attempts
+        """
+        self._fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def write(self, line: str) -> None:
+        """
+        Buffer one log line, flushing when the buffer is full.
+        
+        Args:
+            line (str): Log line including its trailing newline
+        """
+        with self._lock:
+            self._buffer += line.encode()
+            if len(self._buffer) >= self.FLUSH_BYTES:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """
+        Write any buffered lines to the log file.
+        """
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """
+        Write the buffer out, retrying on short writes; caller holds the lock.
+        """
+        written = 0
+        with memoryview(self._buffer) as view:
+            while written < len(view):
+                written += os.write(self._fd, view[written:])
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """
+        Flush buffered lines and close the log file.
+        """
+        with self._lock:
+            if self._fd is None:
+                return
+            self._flush_locked()
+            os.close(self._fd)
+            self._fd = None
+
 
 class AgeVerificationManager:
+    # One open logger per log file, shared by every manager in the process
+    _loggers: Dict[str, AgeVerificationLogger] = {}
+    _loggers_lock = threading.Lock()
+
     @staticmethod
-    def validate_age(birthdate: date, minimum_age: int = 18) -> bool:
+    def validate_age(birthdate: date, minimum_age: int = 18, today: Optional[date] = None) -> bool:
         """
         Validate user's age against a minimum age requirement.
         
         Args:
             birthdate (date): User's birthdate
             minimum_age (int): Minimum age required (default 18)
+            today (date, optional): Reference date; defaults to ``date.today()``
         
         Returns:
             bool: Whether user meets age requirement
         """
-        today = date.today()
+        if today is None:
+            today = date.today()
         age = today.year - birthdate.year - (
             (today.month, today.day) < (birthdate.month, birthdate.day)
         )
         return age >= minimum_age
 
+    @staticmethod
+    def validate_ages(birthdates: Iterable[date], minimum_age: int = 18) -> List[bool]:
+        """
+        Validate many birthdates against one reference date.
+        
+        Args:
+            birthdates (Iterable[date]): Users' birthdates
+            minimum_age (int): Minimum age required (default 18)
+        
+        Returns:
+            List[bool]: Whether each user meets the age requirement
+        """
+        # Resolve today once; the latest qualifying birthdate then decides
+        # every user with a single tuple comparison
+        today = date.today()
+        cutoff = (today.year - minimum_age, today.month, today.day)
+        return [
+            (birthdate.year, birthdate.month, birthdate.day) <= cutoff
+            for birthdate in birthdates
+        ]
+
+    @staticmethod
+    def verify_batch(birthdates: np.ndarray, minimum_age: int = 18) -> np.ndarray:
+        """
+        Validate a large batch of birthdates in one compiled kernel.
+        
+        Args:
+            birthdates (np.ndarray): Integer array of shape (N, 3) holding
+                year, month and day columns
+            minimum_age (int): Minimum age required (default 18)
+        
+        Returns:
+            np.ndarray: Boolean array, True where the user meets the requirement
+        """
+        birthdates = np.asarray(birthdates, dtype=np.int16)
+        years = np.ascontiguousarray(birthdates[:, 0])
+        months = np.ascontiguousarray(birthdates[:, 1])
+        days = np.ascontiguousarray(birthdates[:, 2])
+        
+        today = date.today()
+        out = np.empty(len(birthdates), dtype=np.bool_)
+        _validate_ages(years, months, days, today.year, today.month, today.day, minimum_age, out)
+        return out
+
     @staticmethod
     def parse_birthdate(birthdate_str: str) -> date:
         """
@@ -34,20 +182,45 @@ class AgeVerificationManager:
         Raises:
             ValueError: If birthdate cannot be parsed
         """
-        date_formats = [
-            '%Y-%m-%d',  # ISO format
-            '%m/%d/%Y',  # US format
-            '%d/%m/%Y',  # European format
-        ]
-        
-        for fmt in date_formats:
+        match = _DATE_RE.match(birthdate_str)
+        if match is not None:
+            iso_year, iso_month, iso_day, first, second, year = match.groups()
             try:
-                return datetime.strptime(birthdate_str, fmt).date()
+                if iso_year is not None:
+                    # ISO format
+                    return date(int(iso_year), int(iso_month), int(iso_day))
+                
+                first, second, year = int(first), int(second), int(year)
+                # US format first, European when the first field cannot be a month
+                if 1 <= first <= 12:
+                    try:
+                        return date(year, first, second)
+                    except ValueError:
+                        pass
+                return date(year, second, first)
             except ValueError:
-                continue
+                pass
         
         raise ValueError(f"Unable to parse birthdate: {birthdate_str}")
 
+    @classmethod
+    def get_logger(cls, log_file: str) -> AgeVerificationLogger:
+        """
+        Return the shared buffered logger for a log file, opening it once.
+        
+        Args:
+            log_file (str): Path to log verification attempts
+        
+        Returns:
+            AgeVerificationLogger: Logger appending to ``log_file``
+        """
+        key = os.path.abspath(log_file)
+        with cls._loggers_lock:
+            logger = cls._loggers.get(key)
+            if logger is None:
+                logger = cls._loggers[key] = AgeVerificationLogger(log_file)
+        return logger
+
     def verify_and_log_age_compliance(self, user_data: dict, log_file: str = 'age_verification.log') -> bool:
         """
         Comprehensive age verification with logging.
@@ -59,23 +232,23 @@ class AgeVerificationManager:
         Returns:
             bool: Whether user is compliant with age requirements
         """
+        log = self.get_logger(log_file)
+        
         try:
             birthdate = self.parse_birthdate(user_data['birthdate'])
             is_age_compliant = self.validate_age(birthdate)
             
             # Log verification attempt
-            with open(log_file, 'a') as log:
-                log.write(f"{datetime.now().isoformat()} - "
-                          f"User: {user_data.get('email', 'Unknown')} - "
-                          f"Age Compliant: {is_age_compliant}\n")
+            log.write(f"{datetime.now().isoformat()} - "
+                      f"User: {user_data.get('email', 'Unknown')} - "
+                      f"Age Compliant: {is_age_compliant}\n")
             
             return is_age_compliant
         
         except (KeyError, ValueError) as e:
             # Log and handle invalid data
-            with open(log_file, 'a') as log:
-                log.write(f"{datetime.now().isoformat()} - "
-                          f"Verification Error: {str(e)}\n")
+            log.write(f"{datetime.now().isoformat()} - "
+                      f"Verification Error: {str(e)}\n")
             return False
 
 def main():
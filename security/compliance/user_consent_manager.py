@@ -1,38 +1,151 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
 import json
+import os
+import tempfile
+import threading
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class UserConsentManager:
+    # The journal is folded into a fresh snapshot once it holds more
+    # records than are live (and at least this many)
+    COMPACT_MIN_ENTRIES = 1024
+
     def __init__(self, consent_file: str = 'user_consents.json'):
         """
         Initialize User Consent Manager with persistent storage.
         
+        Consent records live in a JSON snapshot plus an append-only JSONL
+        journal (``<name>.log.jsonl``) holding every record written since
+        the snapshot; mutations append one line instead of rewriting the file.
+        
         Args:
             consent_file (str): Path to store consent records
         """
         self._consent_file = consent_file
+        self._journal_file = os.path.splitext(consent_file)[0] + '.log.jsonl'
+        self._lock = threading.Lock()
+        self._journal_entries = 0
+        self._journal_valid_bytes = 0
         self._consents = self._load_consents()
+        self._journal_fd = os.open(
+            self._journal_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600
+        )
+        # Cut any torn trailing line so the next record starts on its own line
+        os.ftruncate(self._journal_fd, self._journal_valid_bytes)
+        
+        # Lookup indexes: consent IDs per user (dict keys keep registration
+        # order) and active-record counts per (user, purpose), kept in step
+        # with every mutation
+        self._user_index: Dict[str, Dict[str, None]] = {}
+        self._purpose_active: Dict[Tuple[str, str], int] = {}
+        for consent in self._consents.values():
+            self._index_consent(consent)
+
+    def _index_consent(self, consent: Dict):
+        """
+        Add a consent record to the lookup indexes.
+        
+        Args:
+            consent (Dict): Consent record
+        """
+        self._user_index.setdefault(consent['user_id'], {})[consent['consent_id']] = None
+        if consent['status'] == 'active':
+            for purpose in set(consent['purposes']):
+                key = (consent['user_id'], purpose)
+                self._purpose_active[key] = self._purpose_active.get(key, 0) + 1
 
     def _load_consents(self) -> Dict[str, Dict]:
         """
-        Load existing consent records from file.
+        Load the consent snapshot and replay the journal on top of it.
         
         Returns:
             Dict[str, Dict]: Loaded consent records
         """
         try:
             with open(self._consent_file, 'r') as f:
-                return json.load(f)
+                consents = json.load(f)
+        except FileNotFoundError:
+            consents = {}
+        
+        try:
+            with open(self._journal_file, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Torn trailing line from an interrupted write
+                        break
+                    self._journal_valid_bytes += len(line)
+                    try:
+                        record = orjson.loads(line) if orjson is not None else json.loads(line)
+                    except ValueError:
+                        continue
+                    consents[record['consent_id']] = record
+                    self._journal_entries += 1
         except FileNotFoundError:
-            return {}
+            pass
+        
+        return consents
 
     def _save_consents(self):
         """
-        Save consent records to file.
+        Atomically and durably write all consent records to the snapshot file.
         """
-        with open(self._consent_file, 'w') as f:
-            json.dump(self._consents, f, indent=4)
+        consent_dir = os.path.dirname(self._consent_file) or '.'
+        with tempfile.NamedTemporaryFile(
+            'wb', dir=consent_dir, suffix='.tmp', delete=False
+        ) as tmp_file:
+            if orjson is not None:
+                tmp_file.write(orjson.dumps(self._consents, option=orjson.OPT_INDENT_2))
+            else:
+                tmp_file.write(json.dumps(self._consents, indent=4).encode())
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        
+        try:
+            os.replace(tmp_file.name, self._consent_file)
+        except OSError:
+            os.unlink(tmp_file.name)
+            raise
+        
+        # Persist the rename itself
+        dir_fd = os.open(consent_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _append_record(self, record: Dict):
+        """
+        Journal one consent record, compacting when the journal outgrows the
+        live set; the caller holds ``self._lock``.
+        
+        Args:
+            record (Dict): Consent record as it should be replayed
+        """
+        line = (orjson.dumps(record) if orjson is not None else json.dumps(record).encode()) + b'\n'
+        written = 0
+        with memoryview(line) as view:
+            while written < len(view):
+                written += os.write(self._journal_fd, view[written:])
+        self._journal_entries += 1
+        
+        if self._journal_entries > max(self.COMPACT_MIN_ENTRIES, len(self._consents)):
+            # Snapshot (fsynced, rename included) first so a crash before
+            # truncation only replays records the snapshot already holds
+            self._save_consents()
+            os.ftruncate(self._journal_fd, 0)
+            self._journal_entries = 0
+
+    def close(self):
+        """
+        Close the consent journal.
+        """
+        os.close(self._journal_fd)
 
     def register_consent(self, user_id: str, consent_purposes: List[str], version: str = '1.0') -> str:
         """
@@ -56,8 +169,12 @@ class UserConsentManager:
             'status': 'active'
         }
         
-        self._consents[consent_id] = consent_record
-        self._save_consents()
+        # Records, indexes and journal change together under one lock so
+        # compaction never serializes a half-applied mutation
+        with self._lock:
+            self._consents[consent_id] = consent_record
+            self._index_consent(consent_record)
+            self._append_record(consent_record)
         
         return consent_id
 
@@ -68,10 +185,19 @@ class UserConsentManager:
         Args:
             consent_id (str): Consent record ID to revoke
         """
-        if consent_id in self._consents:
-            self._consents[consent_id]['status'] = 'revoked'
-            self._consents[consent_id]['revocation_timestamp'] = datetime.utcnow().isoformat()
-            self._save_consents()
+        with self._lock:
+            if consent_id in self._consents:
+                consent = self._consents[consent_id]
+                if consent['status'] == 'active':
+                    for purpose in set(consent['purposes']):
+                        key = (consent['user_id'], purpose)
+                        self._purpose_active[key] -= 1
+                        if not self._purpose_active[key]:
+                            del self._purpose_active[key]
+                
+                consent['status'] = 'revoked'
+                consent['revocation_timestamp'] = datetime.utcnow().isoformat()
+                self._append_record(consent)
 
     def check_consent(self, user_id: str, purpose: str) -> bool:
         """
@@ -84,14 +210,7 @@ class UserConsentManager:
         Returns:
             bool: Whether consent is active for the purpose
         """
-        user_consents = [
-            consent for consent in self._consents.values()
-            if consent['user_id'] == user_id and 
-               purpose in consent['purposes'] and 
-               consent['status'] == 'active'
-        ]
-        
-        return len(user_consents) > 0
+        return self._purpose_active.get((user_id, purpose), 0) > 0
 
     def get_user_consents(self, user_id: str) -> List[Dict]:
         """
@@ -103,10 +222,11 @@ class UserConsentManager:
         Returns:
             List[Dict]: List of user's consent records
         """
-        return [
-            consent for consent in self._consents.values()
-            if consent['user_id'] == user_id
-        ]
+        with self._lock:
+            return [
+                self._consents[consent_id] 
+                for consent_id in self._user_index.get(user_id, ())
+            ]
 
 def main():
     # Example usage
@@ -0,0 +1,167 @@
+import hashlib
+from typing import List
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Longest message that fits a single padded SHA-256 block
+# (64 bytes minus the 0x80 terminator and the 8-byte bit length)
+MAX_SINGLE_BLOCK_BYTES = 55
+
+_K = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+], dtype=np.int64)
+
+_H0 = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+], dtype=np.int64)
+
+# ASCII hex digit for each nibble value
+_HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+
+
+def _pack_messages(messages: List[bytes]) -> np.ndarray:
+    """
+    Pad messages of at most ``MAX_SINGLE_BLOCK_BYTES`` into one SHA-256 block each.
+
+    Args:
+        messages (List[bytes]): Messages to hash
+
+    Returns:
+        np.ndarray: uint8 array of shape (N, 64), one padded block per row
+    """
+    lengths = np.fromiter((len(message) for message in messages), dtype=np.int64, count=len(messages))
+    rows = np.arange(len(messages))
+    blocks = np.zeros((len(messages), 64), dtype=np.uint8)
+
+    # Scatter the concatenated payload bytes to (row, offset-in-row)
+    payload = np.frombuffer(b''.join(messages), dtype=np.uint8)
+    starts = np.cumsum(lengths) - lengths
+    blocks[np.repeat(rows, lengths), np.arange(payload.size) - np.repeat(starts, lengths)] = payload
+
+    # Terminator bit, then the big-endian bit length (at most 440 bits)
+    blocks[rows, lengths] = 0x80
+    bit_lengths = lengths * 8
+    blocks[:, 62] = bit_lengths >> 8
+    blocks[:, 63] = bit_lengths & 0xff
+    return blocks
+
+
+def _digests_to_hex(digests: np.ndarray) -> List[str]:
+    """
+    Render raw digests as lowercase hex strings through a nibble lookup table.
+
+    Args:
+        digests (np.ndarray): uint8 array of shape (N, 32)
+
+    Returns:
+        List[str]: 64-character hex digest per row
+    """
+    hex_bytes = np.empty((digests.shape[0], 64), dtype=np.uint8)
+    hex_bytes[:, 0::2] = _HEX_DIGITS[digests >> 4]
+    hex_bytes[:, 1::2] = _HEX_DIGITS[digests & 0x0f]
+    text = hex_bytes.tobytes().decode('ascii')
+    return [text[i:i + 64] for i in range(0, len(text), 64)]
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def sha256_mb(blocks, out):
+        """
+        SHA-256 of many single-block messages, one message per parallel iteration.
+
+        Words are held in int64 and masked to 32 bits so intermediate sums
+        never overflow or promote.
+
+        Args:
+            blocks (np.ndarray): uint8 (N, 64) padded blocks from ``_pack_messages``
+            out (np.ndarray): uint8 (N, 32) receiving the raw digests
+        """
+        mask = 0xffffffff
+        for i in prange(blocks.shape[0]):
+            w = np.empty(64, dtype=np.int64)
+            for t in range(16):
+                w[t] = (
+                    (np.int64(blocks[i, 4 * t]) << 24) | (np.int64(blocks[i, 4 * t + 1]) << 16)
+                    | (np.int64(blocks[i, 4 * t + 2]) << 8) | np.int64(blocks[i, 4 * t + 3])
+                )
+            for t in range(16, 64):
+                x = w[t - 15]
+                y = w[t - 2]
+                s0 = (((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)) & mask
+                s1 = (((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)) & mask
+                w[t] = (w[t - 16] + s0 + w[t - 7] + s1) & mask
+
+            a, b, c, d = _H0[0], _H0[1], _H0[2], _H0[3]
+            e, f, g, h = _H0[4], _H0[5], _H0[6], _H0[7]
+            for t in range(64):
+                big_s1 = (((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^ ((e >> 25) | (e << 7))) & mask
+                ch = (e & f) ^ (~e & g & mask)
+                t1 = (h + big_s1 + ch + _K[t] + w[t]) & mask
+                big_s0 = (((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^ ((a >> 22) | (a << 10))) & mask
+                maj = (a & b) ^ (a & c) ^ (b & c)
+                t2 = (big_s0 + maj) & mask
+                h = g
+                g = f
+                f = e
+                e = (d + t1) & mask
+                d = c
+                c = b
+                b = a
+                a = (t1 + t2) & mask
+
+            state = (a, b, c, d, e, f, g, h)
+            for j in range(8):
+                word = (state[j] + _H0[j]) & mask
+                out[i, 4 * j] = (word >> 24) & 0xff
+                out[i, 4 * j + 1] = (word >> 16) & 0xff
+                out[i, 4 * j + 2] = (word >> 8) & 0xff
+                out[i, 4 * j + 3] = word & 0xff
+else:
+    sha256_mb = None
+
+
+def sha256_hex_batch(values: List[str]) -> List[str]:
+    """
+    SHA-256 hex digests of many short strings.
+
+    Values that fit one block are hashed together by ``sha256_mb``; longer
+    values, and every value when Numba is unavailable, go through hashlib.
+
+    Args:
+        values (List[str]): Strings to hash
+
+    Returns:
+        List[str]: Hex digest of each value, in input order
+    """
+    messages = [value.encode() for value in values]
+    if sha256_mb is None:
+        return [hashlib.sha256(message).hexdigest() for message in messages]
+
+    digests: List[str] = [None] * len(messages)
+    short_rows = []
+    for i, message in enumerate(messages):
+        if len(message) <= MAX_SINGLE_BLOCK_BYTES:
+            short_rows.append(i)
+        else:
+            digests[i] = hashlib.sha256(message).hexdigest()
+
+    if short_rows:
+        blocks = _pack_messages([messages[i] for i in short_rows])
+        out = np.empty((len(short_rows), 32), dtype=np.uint8)
+        sha256_mb(blocks, out)
+        for i, digest in zip(short_rows, _digests_to_hex(out)):
+            digests[i] = digest
+
+    return digests
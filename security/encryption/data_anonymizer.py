@@ -1,13 +1,24 @@
 import hashlib
+import os
 import re
-from typing import Dict, Any
-from cryptography.fernet import Fernet
+from typing import Dict, Any, List
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+try:
+    from .anonymizer_batch import sha256_hex_batch
+except ImportError:
+    # Run as a script (no parent package); the module sits next to this file
+    from anonymizer_batch import sha256_hex_batch
+
+# AES-GCM nonce length in bytes; a fresh random nonce prefixes each ciphertext
+NONCE_SIZE = 12
 
 class DataAnonymizer:
     def __init__(self):
-        # Generate a key for encryption
-        self._encryption_key = Fernet.generate_key()
-        self._cipher_suite = Fernet(self._encryption_key)
+        # Generate a key for encryption; AES-GCM runs on AES-NI/PCLMULQDQ
+        # through OpenSSL with a single reusable AEAD object
+        self._encryption_key = AESGCM.generate_key(bit_length=128)
+        self._aead = AESGCM(self._encryption_key)
 
     def hash_sensitive_data(self, data: str) -> str:
         """
@@ -21,17 +32,33 @@ class DataAnonymizer:
         """
         return hashlib.sha256(data.encode()).hexdigest()
 
+    def hash_sensitive_batch(self, values: List[str]) -> List[str]:
+        """
+        Hash many sensitive values with SHA-256 in one call.
+        
+        Short values (emails, phone numbers) are hashed together by the
+        parallel single-block kernel in ``anonymizer_batch``.
+        
+        Args:
+            values (List[str]): The sensitive values to be hashed
+        
+        Returns:
+            List[str]: Hashed representation of each value, in input order
+        """
+        return sha256_hex_batch(values)
+
     def encrypt_data(self, data: str) -> bytes:
         """
-        Encrypt sensitive data using Fernet symmetric encryption.
+        Encrypt sensitive data using AES-128-GCM authenticated encryption.
         
         Args:
             data (str): The data to be encrypted
         
         Returns:
-            bytes: Encrypted data
+            bytes: Nonce followed by the ciphertext and authentication tag
         """
-        return self._cipher_suite.encrypt(data.encode())
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, data.encode(), None)
 
     def decrypt_data(self, encrypted_data: bytes) -> str:
         """
@@ -43,7 +70,8 @@ class DataAnonymizer:
         Returns:
             str: Decrypted data
         """
-        return self._cipher_suite.decrypt(encrypted_data).decode()
+        nonce, ciphertext = encrypted_data[:NONCE_SIZE], encrypted_data[NONCE_SIZE:]
+        return self._aead.decrypt(nonce, ciphertext, None).decode()
 
     def anonymize_user_data(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -55,11 +83,37 @@ class DataAnonymizer:
         Returns:
             Dict[str, Any]: Anonymized user data
         """
-        anonymized_data = user_data.copy()
+        return self._build_anonymized_record(
+            user_data,
+            self.hash_sensitive_data(user_data['email']),
+            self.hash_sensitive_data(user_data['phone']) if 'phone' in user_data else None
+        )
+
+    def _build_anonymized_record(self, user_data: Dict[str, Any], email_hash: str, phone_hash: Any) -> Dict[str, Any]:
+        """
+        Assemble an anonymized record in one pass over the original fields.
         
-        # Fields to anonymize
-        anonymized_data['email'] = self.hash_sensitive_data(user_data['email'])
-        anonymized_data['phone'] = self.hash_sensitive_data(user_data['phone']) if 'phone' in user_data else None
+        Args:
+            user_data (Dict[str, Any]): Original user data dictionary
+            email_hash (str): Hashed email
+            phone_hash: Hashed phone, or None if the record has no phone
+        
+        Returns:
+            Dict[str, Any]: Anonymized user data
+        """
+        # Sensitive fields are written once with their final value instead
+        # of copying the record and overwriting them
+        anonymized_data = {}
+        for field, value in user_data.items():
+            if field == 'email':
+                anonymized_data[field] = email_hash
+            elif field == 'phone':
+                anonymized_data[field] = phone_hash
+            else:
+                anonymized_data[field] = value
+        
+        if phone_hash is None:
+            anonymized_data['phone'] = None
         
         # Optional: Encrypt more sensitive information
         if 'full_name' in user_data:
@@ -67,6 +121,29 @@ class DataAnonymizer:
         
         return anonymized_data
 
+    def anonymize_user_data_batch(self, user_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Anonymize many user records, hashing each sensitive field as one batch.
+        
+        Args:
+            user_records (List[Dict[str, Any]]): Original user data dictionaries
+        
+        Returns:
+            List[Dict[str, Any]]: Anonymized user data, same as calling
+            ``anonymize_user_data`` on each record
+        """
+        # Gather the email and phone columns so each is hashed in one pass
+        email_hashes = self.hash_sensitive_batch([record['email'] for record in user_records])
+        phone_rows = [i for i, record in enumerate(user_records) if 'phone' in record]
+        phone_hashes = [None] * len(user_records)
+        for i, phone_hash in zip(phone_rows, self.hash_sensitive_batch([user_records[i]['phone'] for i in phone_rows])):
+            phone_hashes[i] = phone_hash
+        
+        return [
+            self._build_anonymized_record(record, email_hash, phone_hash)
+            for record, email_hash, phone_hash in zip(user_records, email_hashes, phone_hashes)
+        ]
+
     def validate_anonymization(self, original_data: Dict[str, Any], anonymized_data: Dict[str, Any]) -> bool:
         """
         Validate that anonymization process maintains data integrity.
@@ -0,0 +1,58 @@
+import hashlib
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from security.encryption import anonymizer_batch
+
+
+ASCII_VALUES = ['a' * length for length in range(57)]
+
+# Multi-byte UTF-8 values on both sides of the 55-byte single-block limit
+UTF8_VALUES = [
+    'é' * 27,          # 54 bytes
+    'é' * 27 + 'x',    # 55 bytes
+    'é' * 28,          # 56 bytes
+    '€' * 18 + 'y',    # 55 bytes
+    '€' * 19,          # 57 bytes
+    '用户@例子.公司',
+    '📞+1 555 0100',
+]
+
+
+def _expected(values):
+    return [hashlib.sha256(value.encode()).hexdigest() for value in values]
+
+
+@pytest.mark.parametrize('values', [ASCII_VALUES, UTF8_VALUES, ASCII_VALUES + UTF8_VALUES])
+def test_sha256_hex_batch_matches_hashlib(values):
+    assert anonymizer_batch.sha256_hex_batch(values) == _expected(values)
+
+
+def test_sha256_hex_batch_empty():
+    assert anonymizer_batch.sha256_hex_batch([]) == []
+
+
+def test_known_answers():
+    assert anonymizer_batch.sha256_hex_batch(['', 'abc']) == [
+        'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855',
+        'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad',
+    ]
+
+
+def test_kernel_matches_hashlib_for_single_block_lengths():
+    if anonymizer_batch.sha256_mb is None:
+        pytest.skip('numba is not installed')
+    
+    messages = [value.encode() for value in ASCII_VALUES + UTF8_VALUES]
+    messages = [
+        message for message in messages 
+        if len(message) <= anonymizer_batch.MAX_SINGLE_BLOCK_BYTES
+    ]
+    out = np.empty((len(messages), 32), dtype=np.uint8)
+    anonymizer_batch.sha256_mb(anonymizer_batch._pack_messages(messages), out)
+    
+    assert [row.tobytes() for row in out] == [
+        hashlib.sha256(message).digest() for message in messages
+    ]